@@ -1,11 +1,35 @@
 import requests
+from requests.adapters import HTTPAdapter
 import math
+import heapq
 import time
-import re
 import random
+import string
+import threading
+from functools import lru_cache
+from bisect import bisect_right
+from concurrent.futures import ThreadPoolExecutor, wait, FIRST_COMPLETED
+
+from _address1 import _NOMINATIM_RATE_LIMITER
+
+# Use orjson for faster response parsing when available
+try:
+    import orjson
+    _json_loads = orjson.loads
+except ImportError:
+    import json
+    _json_loads = json.loads
+
+# Use Numba for the ASCII fast path of looks_like_address when available
+try:
+    import numpy as np
+    from numba import njit
+    NUMBA_AVAILABLE = True
+except ImportError:
+    NUMBA_AVAILABLE = False
 
 # Country name to ISO code mapping (O(1) lookup, no file I/O)
-country_mapping_data = {
+_CANONICAL_COUNTRY_CODES = {
     "andorra": "ad", "united arab emirates": "ae", "afghanistan": "af", "antigua and barbuda": "ag",
     "anguilla": "ai", "albania": "al", "armenia": "am", "angola": "ao", "antarctica": "aq",
     "argentina": "ar", "american samoa": "as", "austria": "at", "australia": "au", "aruba": "aw",
@@ -61,57 +85,140 @@ country_mapping_data = {
     "british virgin islands": "vg", "u.s. virgin islands": "vi", "vietnam": "vn", "vanuatu": "vu",
     "wallis and futuna": "wf", "samoa": "ws", "yemen": "ye", "mayotte": "yt", "south africa": "za",
     "zambia": "zm", "zimbabwe": "zw",
-    # Common alternative names
+}
+
+# Common alternative names (only names not already in the canonical table)
+_COUNTRY_ALIASES = {
     "usa": "us", "america": "us", "united states of america": "us", "uk": "gb", "britain": "gb",
-    "great britain": "gb", "england": "gb", "russian federation": "ru", "south korea": "kr",
-    "north korea": "kp", "vietnam": "vn", "iran": "ir", "syria": "sy", "venezuela": "ve",
-    "bolivia": "bo", "tanzania": "tz", "congo": "cd", "macedonia": "mk", "czech republic": "cz",
+    "great britain": "gb", "england": "gb", "russian federation": "ru", "congo": "cd",
     "czechia": "cz"
 }
 
+country_mapping_data = {**_CANONICAL_COUNTRY_CODES, **_COUNTRY_ALIASES}
+
+# Shared session so the HTTPS connection to Nominatim is kept alive across attempts
+_SESSION = requests.Session()
+_SESSION.headers.update({
+    "User-Agent": f"MinerAddressValidator/1.0_{random.randint(1000, 9999)}",
+    "Accept-Language": "en-US,en;q=0.9",
+    "Accept": "application/json",
+    "Accept-Encoding": "gzip, deflate"
+})
+_SESSION.mount("https://", HTTPAdapter(pool_connections=4, pool_maxsize=8))
+
+# Concurrent Nominatim searches per call. Request starts are at most one per second
+# overall (Nominatim usage policy, limiter shared with _address1), so two in flight
+# is enough to overlap one response's processing with the next wait
+_MAX_WORKERS = 2
+
+# Lookups used by looks_like_address (built once, it runs per search result)
+_ASCII_LETTERS = frozenset(string.ascii_letters)
+_SPECIAL_CHARS = frozenset('`:%$@*^[]{}_«»')
+
+# Byte classes for the ASCII kernel (input is already lower-cased)
+_BYTE_OTHER, _BYTE_LETTER, _BYTE_DIGIT, _BYTE_COMMA, _BYTE_SPECIAL = 0, 1, 2, 3, 4
+_ASCII_BYTE_CLASSES = bytearray(128)
+for _c in string.ascii_lowercase:
+    _ASCII_BYTE_CLASSES[ord(_c)] = _BYTE_LETTER
+for _c in string.digits:
+    _ASCII_BYTE_CLASSES[ord(_c)] = _BYTE_DIGIT
+_ASCII_BYTE_CLASSES[ord(',')] = _BYTE_COMMA
+for _c in _SPECIAL_CHARS:
+    if ord(_c) < 128:
+        _ASCII_BYTE_CLASSES[ord(_c)] = _BYTE_SPECIAL
+del _c
+
+
+def _looks_like_ascii_address(buf, classes) -> bool:
+    """
+    looks_like_address checks for a lower-cased ASCII address given as bytes.
+    For ASCII every word character is a-z or 0-9, so one byte walk covers them all.
+    """
+    address_len = 0
+    letter_count = 0
+    has_digit = False
+    comma_count = 0
+    unique_count = 0
+    seen_low = 0  # bitmap of bytes 0-63 seen so far
+    seen_high = 0  # bitmap of bytes 64-127 seen so far
+    for i in range(len(buf)):
+        b = buf[i]
+        cls = classes[b]
+        if cls == _BYTE_SPECIAL:
+            return False
+        if cls == _BYTE_LETTER:
+            address_len += 1
+            letter_count += 1
+        elif cls == _BYTE_DIGIT:
+            address_len += 1
+            has_digit = True
+        elif cls == _BYTE_COMMA:
+            comma_count += 1
+        if address_len > 300:
+            return False
+        if b < 64:
+            bit = 1 << b
+            if not seen_low & bit:
+                seen_low |= bit
+                unique_count += 1
+        else:
+            bit = 1 << (b - 64)
+            if not seen_high & bit:
+                seen_high |= bit
+                unique_count += 1
+    return (address_len >= 30 and letter_count >= 20 and comma_count >= 2
+            and unique_count >= 5 and has_digit)
+
+
+if NUMBA_AVAILABLE:
+    _looks_like_ascii_address = njit(cache=True)(_looks_like_ascii_address)
+    _ASCII_BYTE_CLASSES = np.frombuffer(bytes(_ASCII_BYTE_CLASSES), dtype=np.uint8)
 
 
 def looks_like_address(address: str) -> bool:
     address = address.strip().lower()
 
-    # Keep all letters (Latin and non-Latin) and numbers
-    # Using a more compatible approach for Unicode characters
-    address_len = re.sub(r'[^\w]', '', address.strip(), flags=re.UNICODE)
-    if len(address_len) < 30:
-        return False
-    if len(address_len) > 300:  # maximum length check
-        return False
+    # Compiled kernel handles plain ASCII; other scripts need the Unicode checks below
+    if NUMBA_AVAILABLE and address.isascii():
+        buf = np.frombuffer(address.encode('ascii'), dtype=np.uint8)
+        return _looks_like_ascii_address(buf, _ASCII_BYTE_CLASSES)
 
-    # Count letters (both Latin and non-Latin) - using \w which includes Unicode letters
-    letter_count = len(re.findall(r'[^\W\d]', address, flags=re.UNICODE))
-    if letter_count < 20:
-        return False
+    # Single pass collecting every counter the checks below need
+    address_len = 0  # regex \w characters (letters and numbers, any script)
+    letter_count = 0  # \w minus decimal digits (Latin and non-Latin letters)
+    has_ascii_letter = False
+    has_digit = False  # ASCII 0-9 only, not other numeric characters
+    comma_count = 0
+    for c in address:
+        if c in _SPECIAL_CHARS:
+            # Special characters should not be in addresses
+            return False
+        if c.isalnum():
+            address_len += 1
+            if address_len > 300:  # maximum length check
+                return False
+            if not c.isdecimal():
+                letter_count += 1
+                if c in _ASCII_LETTERS:
+                    has_ascii_letter = True
+            elif '0' <= c <= '9':
+                has_digit = True
+        elif c == ',':
+            comma_count += 1
 
-    if re.match(r"^[^a-zA-Z]*$", address):  # no letters at all
+    if address_len < 30:
         return False
-    if len(set(address)) < 5:  # all chars basically the same
+    if letter_count < 20:
         return False
-    # Has at least one digit in a comma-separated section
-    # Replace hyphens and semicolons with empty strings before counting numbers
-    address_for_number_count = address.replace('-', '').replace(';', '')
-    # Split address by commas and check for numbers in each section
-    sections = [s.strip() for s in address_for_number_count.split(',')]
-    sections_with_numbers = []
-    for section in sections:
-        # Only match ASCII digits (0-9), not other numeric characters
-        number_groups = re.findall(r"[0-9]+", section)
-        if len(number_groups) > 0:
-            sections_with_numbers.append(section)
-    # Need at least 1 section that contains numbers
-    if len(sections_with_numbers) < 1:
+    if not has_ascii_letter:  # no letters at all
         return False
-
-    if address.count(",") < 2:
+    if comma_count < 2:
         return False
-    
-    # Check for special characters that should not be in addresses
-    special_chars = ['`', ':', '%', '$', '@', '*', '^', '[', ']', '{', '}', '_', '«', '»']
-    if any(char in address for char in special_chars):
+    if len(set(address)) < 5:  # all chars basically the same
+        return False
+    # Has at least one ASCII digit (0-9) in some comma-separated section,
+    # i.e. anywhere in the address; hyphens/semicolons/commas don't affect it
+    if not has_digit:
         return False
     
     # # Contains common address words or patterns
@@ -125,21 +232,143 @@ def looks_like_address(address: str) -> bool:
     
     return True
 
+_LAT_M = 111_000.0  # meters per degree latitude
+
+@lru_cache(maxsize=4096)
+def _lon_m(center_lat: float) -> float:
+    """Meters per degree longitude at a (rounded) latitude."""
+    return _LAT_M * math.cos(math.radians(center_lat))
+
 def compute_bounding_box_area_meters(boundingbox):
     """
     Compute bounding box area in square meters (same as validator uses)
     """
     south, north, west, east = map(float, boundingbox)
     
-    # Approx center latitude for longitude scaling
-    center_lat = (south + north) / 2.0
-    lat_m = 111_000  # meters per degree latitude
-    lon_m = 111_000 * math.cos(math.radians(center_lat))  # meters per degree longitude
-    height_m = abs(north - south) * lat_m
-    width_m = abs(east - west) * lon_m
-    area_m2 = width_m * height_m
+    # Approx center latitude for longitude scaling; nearby results share the
+    # cached cosine (0.01 degree rounding is far below the score thresholds)
+    center_lat = round((south + north) * 0.5, 2)
+    return abs(north - south) * _LAT_M * abs(east - west) * _lon_m(center_lat)
+
+# Optimization: Weighted search strategies (favor strategies that find smaller areas)
+_STRATEGIES = ("number_street", "base_term", "mixed")
+_STRATEGY_WEIGHTS = (60, 25, 15)
+
+# Optimization: Weighted numbers (favor smaller numbers for specific addresses)
+_WEIGHTED_NUMBERS = (
+    ("1", "2", "3", "4", "5", "6", "7", "8", "9") * 3  # 3x weight
+    + ("10", "11", "12", "15", "20", "25", "30", "35", "40", "45", "50") * 2  # 2x weight
+    + ("100", "101", "102", "105", "110", "115", "120", "125", "150", "175", "200")  # 1x weight
+)
+
+# Term pools are de-duplicated (order preserved) so each entry is equally likely
+_BASE_TERMS = tuple(dict.fromkeys((
+    # Residential - Basic Types
+    "apartment", "flat", "unit", "suite", "building", "house", "residential", "home",
+    "condo", "condominium", "townhouse", "villa", "mansion", "cottage", "cabin",
+    "duplex", "triplex", "penthouse", "loft", "studio", "maisonette", "bungalow",
+
+    # Residential - Extended Types
+    "residence", "dwelling", "lodging", "quarters", "housing", "domicile", "abode",
+    "farmhouse", "ranch", "estate", "manor", "chalet", "lodge", "retreat", "hideaway",
+    "compound", "complex", "development", "subdivision", "neighborhood", "district",
+
+    # Residential - Multi-family
+    "apartments", "flats", "condos", "townhomes", "rowhouse", "terraced house",
+    "garden apartment", "walk-up", "high-rise", "low-rise", "mid-rise", "tower",
+
+    # Residential - Specific Features
+    "basement apartment", "ground floor", "upper floor", "attic apartment",
+    "garden level", "split level", "two-story", "single family", "multi-family",
+
+    # Residential - International Terms
+    "casa", "maison", "haus", "dom", "palazzo", "chateau", "manor", "dacha",
+    "hacienda", "finca", "quinta", "fazenda", "estancia", "rancheria",
+
+    # Residential - Modern Types
+    "micro apartment", "tiny house", "mobile home", "manufactured home",
+    "modular home", "prefab", "container home", "co-living", "shared housing",
+
+    # Commercial
+    # "office", "shop", "store", "mall", "plaza", "center", "complex", "tower",
+    # "business", "commercial", "retail", "warehouse", "factory", "industrial",
+
+    # # Institutional
+    # "school", "hospital", "church", "library", "museum", "hotel", "restaurant",
+    # "bank", "clinic", "pharmacy", "market", "station", "terminal", "airport",
+
+    # # International terms
+    # "casa", "maison", "haus", "dom", "palazzo", "chateau", "manor"
+)))
+
+_STREETS = tuple(dict.fromkeys((
+    # English
+    "street", "road", "avenue", "drive", "lane", "place", "way", "boulevard",
+    "court", "circle", "crescent", "terrace", "square", "park", "gardens",
+    "close", "grove", "hill", "view", "ridge", "heights", "meadow", "valley",
+    "creek", "river", "lake", "beach", "shore", "bay", "harbor", "port",
+    "bridge", "crossing", "junction", "corner", "plaza", "center", "mall",
+
+    # Abbreviations
+    "st", "rd", "ave", "dr", "ln", "pl", "blvd", "ct", "cir", "ter", "sq",
+
+    # German
+    "straße", "strasse", "gasse", "platz", "weg", "allee", "ring", "damm",
+
+    # French
+    "rue", "avenue", "boulevard", "place", "cours", "quai", "impasse", "passage",
+
+    # Spanish
+    "calle", "avenida", "plaza", "paseo", "carrera", "via", "camino",
+
+    # Italian
+    "via", "corso", "piazza", "viale", "largo", "vicolo",
+
+    # Other international
+    "ulica", "prospekt", "bulvar", "shosse", "pereulok", "naberezhnaya"
+)))
+
+# Area score buckets (same as validator logic): area < 100 m² scores 1.0,
+# < 1000 scores 0.9, < 10000 scores 0.8, < 100000 scores 0.7, otherwise 0.3
+_AREA_THRESHOLDS = (100.0, 1000.0, 10000.0, 100000.0)
+_AREA_SCORES = (1.0, 0.9, 0.8, 0.7, 0.3)
+
+def _search_nominatim(term, iso_code, stop):
+    """
+    Run a single Nominatim search and return the parsed JSON results.
+    Safe to call from worker threads; returns [] without sending the request
+    if stop is set while waiting for the rate limiter.
+    """
+    url = "https://nominatim.openstreetmap.org/search"
+    
+    # Randomize parameters for different results each time
+    offset = random.randint(0, 100)
+    limit = random.randint(10, 20)
     
-    return area_m2
+    params = {
+        "q": term,
+        "format": "json",
+        "addressdetails": 0,  # Only display_name and boundingbox are used
+        "polygon_geojson": 0,
+        "limit": limit,
+        "offset": offset,
+        "accept-language": "en-US,en"  # Prefer English results
+    }
+    
+    # Add country code if available
+    if iso_code:
+        params["countrycodes"] = iso_code
+    
+    # Respect API limits across all workers
+    _NOMINATIM_RATE_LIMITER.wait()
+    # The caller may have finished (or hit its deadline) while we waited
+    if stop.is_set():
+        return []
+    response = _SESSION.get(url, params=params, timeout=5)
+    return _json_loads(response.content)
+
+# Synthetic address generator from _address1, bound lazily on first use
+_fallback_generate_address_variations = None
 
 def generate_address_variations(country, count = 15):
     """
@@ -152,6 +381,8 @@ def generate_address_variations(country, count = 15):
     Returns:
         List of addresses with best scores (prioritizing 1.0 score)
     """
+    global _fallback_generate_address_variations
+    
     # Get country code using direct dictionary lookup (O(1))
     iso_code = country_mapping_data.get(country.lower())
     
@@ -159,239 +390,122 @@ def generate_address_variations(country, count = 15):
         print(f"        Warning: Country '{country}' not found in country mapping, searching without country filter")
         # Continue without country filtering
     
-    high_scoring_addresses = []  # Perfect score addresses (1.0)
-    all_addresses = []  # All valid addresses that pass looks_like_address
+    high_scoring_addresses = []  # Perfect score addresses (1.0), never more than count
+    # Best `count` valid addresses as a min-heap of (score, -area, -seq, address);
+    # the root is the worst kept entry, ties keep the earliest found
+    best_addresses = []
+    found = 0  # Valid addresses seen so far (insertion order for tie-breaks)
     seen_addresses = set()  # Optimization: O(1) duplicate check
     
-    # Optimization: Weighted search strategies (favor strategies that find smaller areas)
-    search_strategies = ["number_street"] * 60 + ["base_term"] * 25 + ["mixed"] * 15
-    
-    # Optimization: Weighted numbers (favor smaller numbers for specific addresses)
-    small_numbers = ["1", "2", "3", "4", "5", "6", "7", "8", "9"] * 3  # 3x weight
-    medium_numbers = ["10", "11", "12", "15", "20", "25", "30", "35", "40", "45", "50"] * 2  # 2x weight
-    large_numbers = ["100", "101", "102", "105", "110", "115", "120", "125", "150", "175", "200"]  # 1x weight
-    weighted_numbers = small_numbers + medium_numbers + large_numbers
-    
-    base_terms = [
-        # Residential - Basic Types
-        "apartment", "flat", "unit", "suite", "building", "house", "residential", "home",
-        "condo", "condominium", "townhouse", "villa", "mansion", "cottage", "cabin",
-        "duplex", "triplex", "penthouse", "loft", "studio", "maisonette", "bungalow",
-        
-        # Residential - Extended Types
-        "residence", "dwelling", "lodging", "quarters", "housing", "domicile", "abode",
-        "farmhouse", "ranch", "estate", "manor", "chalet", "lodge", "retreat", "hideaway",
-        "compound", "complex", "development", "subdivision", "neighborhood", "district",
-        
-        # Residential - Multi-family
-        "apartments", "flats", "condos", "townhomes", "rowhouse", "terraced house",
-        "garden apartment", "walk-up", "high-rise", "low-rise", "mid-rise", "tower",
-        
-        # Residential - Specific Features
-        "basement apartment", "ground floor", "upper floor", "attic apartment",
-        "garden level", "split level", "two-story", "single family", "multi-family",
-        
-        # Residential - International Terms
-        "casa", "maison", "haus", "dom", "palazzo", "chateau", "manor", "dacha",
-        "hacienda", "finca", "quinta", "fazenda", "estancia", "rancheria",
-        
-        # Residential - Modern Types
-        "micro apartment", "tiny house", "mobile home", "manufactured home",
-        "modular home", "prefab", "container home", "co-living", "shared housing",
-        
-        # Commercial
-        # "office", "shop", "store", "mall", "plaza", "center", "complex", "tower",
-        # "business", "commercial", "retail", "warehouse", "factory", "industrial",
-        
-        # # Institutional
-        # "school", "hospital", "church", "library", "museum", "hotel", "restaurant",
-        # "bank", "clinic", "pharmacy", "market", "station", "terminal", "airport",
-        
-        # # International terms
-        # "casa", "maison", "haus", "dom", "palazzo", "chateau", "manor"
-    ]
-    
-    numbers = [
-        # Single digits
-        "1", "2", "3", "4", "5", "6", "7", "8", "9",
-        
-        # Teens
-        "10", "11", "12", "13", "14", "15", "16", "17", "18", "19",
-        
-        # Twenties
-        "20", "21", "22", "23", "24", "25", "26", "27", "28", "29",
-        
-        # Common numbers
-        "30", "35", "40", "45", "50", "55", "60", "65", "70", "75", "80", "85", "90", "95",
-        
-        # Hundreds
-        "100", "101", "102", "105", "110", "115", "120", "125", "150", "175", "200",
-        "250", "300", "350", "400", "450", "500", "555", "600", "700", "800", "900",
-        
-        # Common patterns
-        "123", "234", "345", "456", "567", "678", "789", "111", "222", "333", "444",
-        "1000", "1001", "1010", "1100", "1200", "1234", "1500", "2000"
-    ]
-    
-    streets = [
-        # English
-        "street", "road", "avenue", "drive", "lane", "place", "way", "boulevard",
-        "court", "circle", "crescent", "terrace", "square", "park", "gardens",
-        "close", "grove", "hill", "view", "ridge", "heights", "meadow", "valley",
-        "creek", "river", "lake", "beach", "shore", "bay", "harbor", "port",
-        "bridge", "crossing", "junction", "corner", "plaza", "center", "mall",
-        
-        # Abbreviations
-        "st", "rd", "ave", "dr", "ln", "pl", "blvd", "ct", "cir", "ter", "sq",
-        
-        # German
-        "straße", "strasse", "gasse", "platz", "weg", "allee", "ring", "damm",
-        
-        # French
-        "rue", "avenue", "boulevard", "place", "cours", "quai", "impasse", "passage",
-        
-        # Spanish
-        "calle", "avenida", "plaza", "paseo", "carrera", "via", "camino",
-        
-        # Italian
-        "via", "corso", "piazza", "viale", "largo", "vicolo",
-        
-        # Other international
-        "ulica", "prospekt", "bulvar", "shosse", "pereulok", "naberezhnaya"
-    ]
-    
     # Keep searching until we have exact count
     start_time = time.time()
     time_limit = 30  # 30 seconds time limit
     attempts = 0
     max_attempts = 100  # Prevent infinite loop
     
-    while attempts < max_attempts:
-        # Optimization: Early exit - check BEFORE expensive operations
-        if len(high_scoring_addresses) >= count:
-            break
-            
-        # Check time limit
-        if time.time() - start_time > time_limit:
-            print(f"        Error - {country} Time limit ({time_limit}s) reached. Found {len(high_scoring_addresses)}/{count} addresses.")
-            break
-        attempts += 1
-        
-        # Optimization: Use weighted search strategies
-        search_type = random.choice(search_strategies)
-        
-        if search_type == "number_street":
-            term = f"{random.choice(weighted_numbers)} {random.choice(streets)} {country}"
-        elif search_type == "base_term":
-            term = f"{random.choice(base_terms)} {country}"
-        else:
-            term = f"{random.choice(base_terms)} {random.choice(weighted_numbers)} {country}"
-        
-        try:
-            url = "https://nominatim.openstreetmap.org/search"
-            
-            # Randomize parameters for different results each time
-            offset = random.randint(0, 100)
-            limit = random.randint(10, 20)
-            
-            params = {
-                "q": term,
-                "format": "json",
-                "addressdetails": 1,
-                "limit": limit,
-                "offset": offset,
-                "accept-language": "en-US,en"  # Prefer English results
-            }
-            
-            # Add country code if available
-            if iso_code:
-                params["countrycodes"] = iso_code
-            
-            # Headers to get US/English results
-            random_id = random.randint(1000, 9999)
-            headers = {
-                "User-Agent": f"MinerAddressValidator/1.0_{random_id}",
-                "Accept-Language": "en-US,en;q=0.9",
-                "Accept": "application/json"
-            }
+    # Run several searches concurrently; the shared rate limiter keeps request
+    # starts spaced out the same way the old per-attempt sleep did
+    executor = ThreadPoolExecutor(max_workers=_MAX_WORKERS)
+    stop = threading.Event()  # Set once results are no longer needed
+    pending = {}  # future -> search term
+    try:
+        while True:
+            # Optimization: Early exit - check BEFORE expensive operations
+            if len(high_scoring_addresses) >= count:
+                break
             
-            response = requests.get(url, params=params, headers=headers, timeout=5)
-            results = response.json()
+            # Check time limit
+            remaining = time_limit - (time.time() - start_time)
+            if remaining <= 0:
+                print(f"        Error - {country} Time limit ({time_limit}s) reached. Found {len(high_scoring_addresses)}/{count} addresses.")
+                break
             
-            for result in results:
-                # Optimization: Early exit in inner loop
-                if len(high_scoring_addresses) >= count:
-                    break
-                    
-                display_name = result.get('display_name', '')
-                if not display_name or "boundingbox" not in result:
-                    continue
+            # Keep every worker busy until we run out of attempts
+            while attempts < max_attempts and len(pending) < _MAX_WORKERS:
+                attempts += 1
                 
-                # Optimization: O(1) duplicate check using set
-                if display_name in seen_addresses:
-                    continue
-                seen_addresses.add(display_name)
+                # Optimization: Use weighted search strategies
+                search_type = random.choices(_STRATEGIES, weights=_STRATEGY_WEIGHTS)[0]
                 
-                # STEP 1: Check if address passes looks_like_address validation
-                if not looks_like_address(display_name):
-                    continue
-                
-                # STEP 2: Calculate bounding box score
-                area = compute_bounding_box_area_meters(result["boundingbox"])
-                
-                # Score based on area (same as validator logic)
-                if area < 100:
-                    score = 1.0
-                elif area < 1000:
-                    score = 0.9
-                elif area < 10000:
-                    score = 0.8
-                elif area < 100000:
-                    score = 0.7
+                if search_type == "number_street":
+                    term = f"{random.choice(_WEIGHTED_NUMBERS)} {random.choice(_STREETS)} {country}"
+                elif search_type == "base_term":
+                    term = f"{random.choice(_BASE_TERMS)} {country}"
                 else:
-                    score = 0.3
+                    term = f"{random.choice(_BASE_TERMS)} {random.choice(_WEIGHTED_NUMBERS)} {country}"
                 
-                # STEP 3: Add to all_addresses (all valid addresses)
-                address_info = {
-                    "address": display_name,
-                    "score": score,
-                    "area": area
-                }
-                all_addresses.append(address_info)
-                
-                # STEP 4: Also add to high_scoring if perfect score
-                if score >= 0.9:
-                    high_scoring_addresses.append(address_info)
-            
-            # Small delay to respect API limits
-            time.sleep(0.5)
+                pending[executor.submit(_search_nominatim, term, iso_code, stop)] = term
             
-            # Optimization: Check again AFTER processing results to avoid unnecessary API calls
-            if len(high_scoring_addresses) >= count:
+            if not pending:
                 break
+            
+            done, _ = wait(pending, timeout=remaining, return_when=FIRST_COMPLETED)
+            for future in done:
+                term = pending.pop(future)
+                try:
+                    results = future.result()
+                except Exception as e:
+                    print(f"        Error with search term '{term}': {e}")
+                    continue
                 
-        except Exception as e:
-            print(f"        Error with search term '{term}': {e}")
-            continue
+                for result in results:
+                    # Optimization: Early exit in inner loop
+                    if len(high_scoring_addresses) >= count:
+                        break
+                        
+                    display_name = result.get('display_name', '')
+                    if not display_name or "boundingbox" not in result:
+                        continue
+                    
+                    # Optimization: O(1) duplicate check using set
+                    if display_name in seen_addresses:
+                        continue
+                    seen_addresses.add(display_name)
+                    
+                    # STEP 1: Check if address passes looks_like_address validation
+                    if not looks_like_address(display_name):
+                        continue
+                    
+                    # STEP 2: Calculate bounding box score
+                    area = compute_bounding_box_area_meters(result["boundingbox"])
+                    
+                    # Score based on area (same as validator logic)
+                    score = _AREA_SCORES[bisect_right(_AREA_THRESHOLDS, area)]
+                    
+                    # STEP 3: Keep it if it ranks among the best `count` addresses
+                    found += 1
+                    entry = (score, -area, -found, display_name)
+                    if len(best_addresses) < count:
+                        heapq.heappush(best_addresses, entry)
+                    else:
+                        heapq.heappushpop(best_addresses, entry)
+                    
+                    # STEP 4: Also add to high_scoring if perfect score
+                    if score >= 0.9:
+                        high_scoring_addresses.append(display_name)
+    finally:
+        # Don't wait on searches that are no longer needed: queued ones are
+        # cancelled, running ones skip their request after the limiter
+        # (shutdown(cancel_futures=True) needs Python 3.9)
+        stop.set()
+        for future in pending:
+            future.cancel()
+        executor.shutdown(wait=False)
     
     # Ensure we return exactly the requested count
     if len(high_scoring_addresses) >= count:
-        # Optimization: Slice once and reuse
-        selected_addresses = high_scoring_addresses[:count]
-        # Return just the address strings
-        return [addr["address"] for addr in selected_addresses]
+        return high_scoring_addresses[:count]
     else:
-        # Optimization: Sort and slice in one operation to avoid processing extra items
-        all_addresses_sorted = sorted(all_addresses, key=lambda x: (-x["score"], x["area"]))[:count]
-        print(f"         hig_socoring_address: {len(high_scoring_addresses)}/{len(all_addresses_sorted)}")
-        # Optimization: Extract addresses in one list comprehension
-        return_address = []
-        for addr in all_addresses_sorted:  # Added missing colon
-            return_address.append(addr["address"])
+        # Heap holds at most `count` entries; order best score, then smallest area
+        best_sorted = sorted(best_addresses, reverse=True)
+        print(f"         hig_socoring_address: {len(high_scoring_addresses)}/{len(best_sorted)}")
+        return_address = [entry[3] for entry in best_sorted]
         
         if len(return_address) < count:
-            from _address1 import generate_address_variations as generate_address_variations1  # Fixed import
-            address_fallback = generate_address_variations1(country, count - len(return_address))
+            if _fallback_generate_address_variations is None:
+                # Imported on first shortfall only (pulls in geonamescache data)
+                from _address1 import generate_address_variations as _fallback_generate_address_variations
+            address_fallback = _fallback_generate_address_variations(country, count - len(return_address))
             return_address.extend(address_fallback)  # Changed append to extend for list
         
         return return_address
@@ -2,14 +2,27 @@ import re
 import random
 import json
 import os
-import sys
 import time
-from datetime import datetime, timedelta
-from typing import List, Dict, Optional
+import logging
+import pickle
+import threading
+from array import array
+from typing import List, Dict, Optional, Set, Tuple, FrozenSet, NamedTuple
+from functools import lru_cache
+from bisect import bisect_left
+from collections import defaultdict
+
+# Use orjson (optional, in requirements.txt) for faster JSON parsing when available
+try:
+    import orjson
+    _json_loads = orjson.loads
+except ImportError:
+    _json_loads = json.loads
 
 # Import requests for Nominatim API queries
 try:
     import requests
+    from requests.adapters import HTTPAdapter
     REQUESTS_AVAILABLE = True
 except ImportError:
     REQUESTS_AVAILABLE = False
@@ -30,6 +43,40 @@ except ImportError:
     UNIDECODE_AVAILABLE = False
     print("⚠️  Warning: unidecode not available. Non-Latin scripts may not work well.")
 
+logger = logging.getLogger(__name__)
+logger.addHandler(logging.NullHandler())
+
+# Keys already warned about, so repeat failures don't flood the log (bounded)
+_WARNED_KEYS: Set[str] = set()
+_MAX_WARNED_KEYS = 1024
+
+def _warn_once(key: str, message: str, *args):
+    """Log a warning the first time key is seen."""
+    if key in _WARNED_KEYS:
+        return
+    if len(_WARNED_KEYS) < _MAX_WARNED_KEYS:
+        _WARNED_KEYS.add(key)
+    logger.warning(message, *args)
+
+# Nominatim address fields that may hold the street name, in preference order
+_ROAD_KEYS = ('road', 'street', 'street_name', 'residential', 'pedestrian', 'path')
+# Nominatim result types that are roads themselves
+_HIGHWAY_TYPES = frozenset({'residential', 'primary', 'secondary', 'tertiary', 'unclassified'})
+# Patterns for pulling street/house numbers out of Nominatim display names
+_STREET_NUM_RE = re.compile(r'^(\d+)\s+(.+?)$')
+_NUM_IN_FIRST_RE = re.compile(r'\b(\d+)\b')
+# Words skipped when deriving a placeholder city from the country name
+_COUNTRY_STOPWORDS = frozenset({"the", "of", "and", "republic", "democratic"})
+
+def _name_key(name: str) -> str:
+    """
+    Single normalization for country/city names: index keys and lookups must agree.
+    Uses lower() rather than casefold() on purpose - the validator's city_in_country
+    compares lower()-ed names, and casefold() would accept matches it rejects
+    (e.g. "strasse" vs "straße").
+    """
+    return name.lower().strip()
+
 # Import geonamescache for getting real city names
 try:
     import geonamescache
@@ -38,57 +85,143 @@ try:
     _geonames_cache = None
     _cities_cache = None
     _countries_cache = None
+    # Indices built once alongside the cache (avoid scanning every city per call)
+    _country_code_by_name: Dict[str, str] = {}  # lowercased country name -> country code
+    # City names live in one UTF-8 blob, grouped by country; each country maps to
+    # its offsets into it (n + 1 boundaries), so ~140k names are not held as str objects
+    _cities_blob = b""
+    _city_offsets_by_code: Dict[str, array] = {}  # country code -> offsets into _cities_blob
+    _city_names_by_code: Dict[str, FrozenSet[str]] = {}  # country code -> lowercased city names
+    _geonames_init_lock = threading.Lock()
+    _geonames_indices_ready = False
+    # Prebuilt indices written by scripts/build_city_index.py; optional
+    _CITY_INDEX_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), "_city_index.pkl")
+    _CITY_INDEX_VERSION = 3
     
     def get_geonames_data():
-        """Get cached geonames data, loading it only once."""
-        global _geonames_cache, _cities_cache, _countries_cache
-        if _geonames_cache is None:
-            _geonames_cache = geonamescache.GeonamesCache()
-            _cities_cache = _geonames_cache.get_cities()
-            _countries_cache = _geonames_cache.get_countries()
+        """Get cached geonames data, loading it only once (thread-safe).
+        
+        Indices come from the prebuilt pickle when present, in which case
+        geonamescache is never parsed and (None, None) is returned.
+        """
+        global _geonames_cache, _cities_cache, _countries_cache, _geonames_indices_ready
+        if not _geonames_indices_ready:
+            with _geonames_init_lock:
+                if not _geonames_indices_ready:
+                    if not _load_city_index():
+                        geonames = geonamescache.GeonamesCache()
+                        cities = geonames.get_cities()
+                        countries = geonames.get_countries()
+                        _build_geonames_indices(cities, countries)
+                        _cities_cache = cities
+                        _countries_cache = countries
+                        _geonames_cache = geonames
+                    # Published last so the unlocked check never sees half-built indices
+                    _geonames_indices_ready = True
         return _cities_cache, _countries_cache
     
-    def get_cities_for_country(country_name: str) -> List[str]:
-        """Get a list of real city names for a given country."""
-        if not country_name or not GEONAMESCACHE_AVAILABLE:
-            return []
-        
+    def _load_city_index(path: str = _CITY_INDEX_PATH) -> bool:
+        """Fill the indices from the prebuilt pickle. False if missing or stale."""
+        global _cities_blob
         try:
-            cities, countries = get_geonames_data()
-            country_name_lower = country_name.lower().strip()
-            
-            # Find country code
-            country_code = None
-            for code, data in countries.items():
-                if data.get('name', '').lower().strip() == country_name_lower:
-                    country_code = code
-                    break
-            
-            if not country_code:
-                return []
-            
-            # Get cities for this country
-            country_cities = []
-            for city_id, city_data in cities.items():
-                if city_data.get("countrycode", "") == country_code:
-                    city_name = city_data.get("name", "")
-                    if city_name and len(city_name) >= 3:  # Filter very short names
-                        country_cities.append(city_name)
-            
-            return country_cities
-        except Exception as e:
-            return []
+            with open(path, "rb") as f:
+                data = pickle.load(f)
+        except (OSError, EOFError, pickle.UnpicklingError):
+            return False
+        if not isinstance(data, dict) or data.get("version") != _CITY_INDEX_VERSION:
+            return False
+        _country_code_by_name.update(data["country_code_by_name"])
+        _cities_blob = data["cities_blob"]
+        _city_offsets_by_code.update(data["city_offsets_by_code"])
+        _city_names_by_code.update(data["city_names_by_code"])
+        return True
+    
+    def save_city_index(path: str = _CITY_INDEX_PATH) -> str:
+        """Build the indices from geonamescache and pickle them to path."""
+        geonames = geonamescache.GeonamesCache()
+        _build_geonames_indices(geonames.get_cities(), geonames.get_countries())
+        data = {
+            "version": _CITY_INDEX_VERSION,
+            "country_code_by_name": dict(_country_code_by_name),
+            "cities_blob": _cities_blob,
+            "city_offsets_by_code": dict(_city_offsets_by_code),
+            "city_names_by_code": dict(_city_names_by_code),
+        }
+        with open(path, "wb") as f:
+            pickle.dump(data, f, protocol=pickle.HIGHEST_PROTOCOL)
+        return path
+    
+    def warm_geonames_cache():
+        """Load geonames data and its indices up front.
+        
+        Call once at startup (before forking workers) so requests never pay
+        the load cost and forked children share the parent's pages.
+        """
+        get_geonames_data()
+    
+    def _build_geonames_indices(cities, countries):
+        """Build country-name and per-country city indices in one pass over each table."""
+        global _cities_blob
+        # geonamescache always populates name/countrycode, so index directly
+        for code, data in countries.items():
+            # First match wins, same as the linear scans this replaces
+            _country_code_by_name.setdefault(_name_key(data['name']), code)
+        cities_by_code = defaultdict(list)
+        city_names_by_code = defaultdict(set)
+        for city_data in cities.values():
+            country_code = city_data["countrycode"]
+            city_name = city_data["name"]
+            cities_by_code[country_code].append(city_name)
+            city_names_by_code[country_code].add(_name_key(city_name))
+        parts = []
+        position = 0
+        city_offsets_by_code = {}
+        for country_code, city_names in cities_by_code.items():
+            offsets = array('I', [position])
+            for city_name in city_names:
+                encoded = city_name.encode('utf-8')
+                parts.append(encoded)
+                position += len(encoded)
+                offsets.append(position)
+            city_offsets_by_code[country_code] = offsets
+        _cities_blob = b"".join(parts)
+        # Offsets only make sense against this blob, so replace rather than merge
+        _city_offsets_by_code.clear()
+        _city_offsets_by_code.update(city_offsets_by_code)
+        _city_names_by_code.update(
+            (country_code, frozenset(city_names)) for country_code, city_names in city_names_by_code.items()
+        )
+    
+    def _cities_in(country_code: str):
+        """Yield a country's city names, decoded from the shared blob on demand."""
+        offsets = _city_offsets_by_code.get(country_code)
+        if not offsets:
+            return
+        blob = _cities_blob
+        start = offsets[0]
+        for end in offsets[1:]:
+            yield blob[start:end].decode('utf-8')
+            start = end
+    
+    def get_cities_for_country(country_name: str) -> Tuple[str, ...]:
+        """Get a list of real city names for a given country."""
+        return resolve_country(country_name).cities
             
 except ImportError:
     GEONAMESCACHE_AVAILABLE = False
     _geonames_cache = None
     
-    def get_cities_for_country(country_name: str) -> List[str]:
+    def warm_geonames_cache():
         """Fallback when geonamescache is not available."""
-        return []
+        return None
+    
+    def get_cities_for_country(country_name: str) -> Tuple[str, ...]:
+        """Fallback when geonamescache is not available."""
+        return ()
 
 
 
+@lru_cache(maxsize=4096)
 def validate_city_in_country(city_name: str, country_name: str) -> bool:
     """
     Validate that a city exists in the country using geonamescache.
@@ -98,160 +231,238 @@ def validate_city_in_country(city_name: str, country_name: str) -> bool:
         return False
     
     try:
-        cities, countries = get_geonames_data()
-        city_name_lower = city_name.lower().strip()
-        country_name_lower = country_name.lower().strip()
-        
-        # Find country code
-        country_code = None
-        for code, data in countries.items():
-            if data.get('name', '').lower().strip() == country_name_lower:
-                country_code = code
-                break
+        city_name_lower = _name_key(city_name)
+        country = resolve_country(country_name)
         
-        if not country_code:
+        if not country.code:
             return False
         
         # Only check cities that are actually in the specified country
+        country_city_names = country.city_set
+        
+        # Check exact match first (validator's logic)
+        if city_name_lower in country_city_names:
+            return True
+        
+        # Multi-word names may also match on their first or second word
         city_words = city_name_lower.split()
+        if len(city_words) < 2:
+            return False
         
-        for city_id, city_data in cities.items():
-            # Skip cities not in the target country
-            if city_data.get("countrycode", "") != country_code:
-                continue
-                
-            city_data_name = city_data.get("name", "").lower().strip()
-            
-            # Check exact match first (validator's logic)
-            if city_data_name == city_name_lower:
-                return True
-            # Check first word match
-            elif len(city_words) >= 2 and city_data_name.startswith(city_words[0]):
-                return True
-            # Check second word match
-            elif len(city_words) >= 2 and city_words[1] in city_data_name:
+        first_word, second_word = city_words[0], city_words[1]
+        for city_data_name in country_city_names:
+            # Check first word match (anchored, cheaper), then second word match
+            if city_data_name.startswith(first_word) or second_word in city_data_name:
                 return True
         
         return False
     except Exception:
+        logger.debug("City validation failed for %r in %r", city_name, country_name, exc_info=True)
         return False
 
+# Duplicate of the validator's COUNTRY_MAPPING, built once at import
+COUNTRY_MAPPING = {
+    "korea, south": "south korea",
+    "korea, north": "north korea",
+    "cote d ivoire": "ivory coast",
+    "côte d'ivoire": "ivory coast",
+    "cote d'ivoire": "ivory coast",
+    "the gambia": "gambia",
+    "netherlands": "the netherlands",
+    "holland": "the netherlands",
+    "congo, democratic republic of the": "democratic republic of the congo",
+    "democratic republic of the": "democratic republic of the congo",  # Added variant for truncated country names
+    "drc": "democratic republic of the congo",
+    "congo, republic of the": "republic of the congo",
+    "burma": "myanmar",
+    "bonaire": "bonaire, saint eustatius and saba",
+    "usa": "united states",
+    "us": "united states",
+    "united states of america": "united states",
+    "uk": "united kingdom",
+    "great britain": "united kingdom",
+    "britain": "united kingdom",
+    "uae": "united arab emirates",
+    "u.s.a.": "united states",
+    "u.s.": "united states",
+    "u.k.": "united kingdom",
+}
+
+@lru_cache(maxsize=1024)
 def normalize_country_name(country: str) -> str:
     """
     Normalize country name to match validator's COUNTRY_MAPPING.
     This ensures region matching works correctly.
     """
-    # Import COUNTRY_MAPPING from validator (or duplicate the mapping)
-    COUNTRY_MAPPING = {
-        "korea, south": "south korea",
-        "korea, north": "north korea",
-        "cote d ivoire": "ivory coast",
-        "côte d'ivoire": "ivory coast",
-        "cote d'ivoire": "ivory coast",
-        "the gambia": "gambia",
-        "netherlands": "the netherlands",
-        "holland": "the netherlands",
-        "congo, democratic republic of the": "democratic republic of the congo",
-        "democratic republic of the": "democratic republic of the congo",  # Added variant for truncated country names
-        "drc": "democratic republic of the congo",
-        "congo, republic of the": "republic of the congo",
-        "burma": "myanmar",
-        "bonaire": "bonaire, saint eustatius and saba",
-        "usa": "united states",
-        "us": "united states",
-        "united states of america": "united states",
-        "uk": "united kingdom",
-        "great britain": "united kingdom",
-        "britain": "united kingdom",
-        "uae": "united arab emirates",
-        "u.s.a.": "united states",
-        "u.s.": "united states",
-        "u.k.": "united kingdom",
-    }
-    
-    country_lower = country.lower().strip()
+    country_lower = _name_key(country)
     normalized = COUNTRY_MAPPING.get(country_lower, country_lower)
     # Return original format but with normalized value for lookup
     # Preserve original case/format but use normalized for validation
     return normalized
 
+class _ResolvedCountry(NamedTuple):
+    """Everything the city helpers need about one country, looked up once."""
+    name: str
+    normalized: str  # COUNTRY_MAPPING form, as from normalize_country_name
+    code: Optional[str]  # geonames code for the name as given (validator semantics)
+    cities: Tuple[str, ...]  # geonames city names, len >= 3
+    city_set: FrozenSet[str]  # lowercased geonames city names
+
+_EMPTY_CITY_SET: FrozenSet[str] = frozenset()
+
+@lru_cache(maxsize=256)
+def resolve_country(country_name: str) -> _ResolvedCountry:
+    """Resolve a country name to its normalized form, geonames code and cities."""
+    normalized = normalize_country_name(country_name) if country_name else ""
+    code = None
+    cities: Tuple[str, ...] = ()
+    city_set = _EMPTY_CITY_SET
+    if country_name and GEONAMESCACHE_AVAILABLE:
+        try:
+            get_geonames_data()
+            code = _country_code_by_name.get(_name_key(country_name))
+            if code:
+                cities = tuple(
+                    city_name for city_name in _cities_in(code)
+                    if city_name and len(city_name) >= 3  # Filter very short names
+                )
+                city_set = _city_names_by_code.get(code, _EMPTY_CITY_SET)
+        except Exception:
+            logger.debug("City lookup failed for %r", country_name, exc_info=True)
+            code, cities, city_set = None, (), _EMPTY_CITY_SET
+    return _ResolvedCountry(country_name, normalized, code, cities, city_set)
+
+# City tuples shared by several alias keys below
+_DRC_CITIES = ("Kinshasa", "Lubumbashi", "Mbuji-Mayi", "Bukavu", "Kananga", "Kisangani", "Goma", "Matadi")
+_IVORY_COAST_CITIES = ("Abidjan", "Bouaké", "Daloa", "Yamoussoukro", "San-Pédro", "Korhogo", "Man", "Divo")
+_MYANMAR_CITIES = ("Yangon", "Mandalay", "Naypyidaw", "Mawlamyine", "Taunggyi", "Monywa", "Sittwe", "Pathein")
+_NETHERLANDS_CITIES = ("Amsterdam", "Rotterdam", "The Hague", "Utrecht", "Eindhoven", "Groningen", "Tilburg", "Almere")
+_GAMBIA_CITIES = ("Banjul", "Serekunda", "Brikama", "Bakau", "Farafenni", "Lamin", "Sukuta", "Basse Santa Su")
+_UAE_CITIES = ("Dubai", "Abu Dhabi", "Sharjah", "Al Ain", "Ajman", "Ras Al Khaimah", "Fujairah", "Umm Al Quwain")
+_UK_CITIES = ("London", "Birmingham", "Manchester", "Glasgow", "Liverpool", "Leeds", "Edinburgh", "Sheffield")
+_USA_CITIES = ("New York", "Los Angeles", "Chicago", "Houston", "Phoenix", "Philadelphia", "San Antonio", "San Diego")
+
 # Well-known cities for countries that might not be in geonamescache or when lookup fails
 # Mapped from sanctioned_countries.json - all countries should have real cities here
-WELL_KNOWN_CITIES = {
+WELL_KNOWN_CITIES: Dict[str, Tuple[str, ...]] = {
     # Latin script countries
-    "cuba": ["Havana", "Santiago de Cuba", "Camagüey", "Holguín", "Santa Clara", "Guantánamo", "Bayamo", "Cienfuegos"],
-    "venezuela": ["Caracas", "Maracaibo", "Valencia", "Barquisimeto", "Ciudad Guayana", "Mérida", "San Cristóbal", "Barinas"],
-    "south sudan": ["Juba", "Malakal", "Wau", "Yei", "Bentiu", "Aweil", "Rumbek", "Torit"],
-    "central african republic": ["Bangui", "Bimbo", "Berbérati", "Carnot", "Bambari", "Bouar", "Bossangoa", "Bria"],
-    "democratic republic of the congo": ["Kinshasa", "Lubumbashi", "Mbuji-Mayi", "Bukavu", "Kananga", "Kisangani", "Goma", "Matadi"],
-    "democratic republic of the": ["Kinshasa", "Lubumbashi", "Mbuji-Mayi", "Bukavu", "Kananga", "Kisangani", "Goma", "Matadi"],  # Variant
-    "mali": ["Bamako", "Sikasso", "Mopti", "Koutiala", "Kayes", "Ségou", "Gao", "Timbuktu"],
-    "nicaragua": ["Managua", "León", "Granada", "Masaya", "Matagalpa", "Chinandega", "Estelí", "Jinotega"],
-    "angola": ["Luanda", "Huambo", "Lobito", "Benguela", "Kuito", "Lubango", "Malanje", "Namibe"],
-    "bolivia": ["La Paz", "Santa Cruz", "Cochabamba", "Sucre", "Oruro", "Tarija", "Potosí", "Trinidad"],
-    "burkina faso": ["Ouagadougou", "Bobo-Dioulasso", "Koudougou", "Ouahigouya", "Banfora", "Dédougou", "Kaya", "Tenkodogo"],
-    "cameroon": ["Douala", "Yaoundé", "Garoua", "Bafoussam", "Bamenda", "Maroua", "Kribi", "Buea"],
-    "ivory coast": ["Abidjan", "Bouaké", "Daloa", "Yamoussoukro", "San-Pédro", "Korhogo", "Man", "Divo"],
-    "côte d'ivoire": ["Abidjan", "Bouaké", "Daloa", "Yamoussoukro", "San-Pédro", "Korhogo", "Man", "Divo"],  # Variant
-    "cote d'ivoire": ["Abidjan", "Bouaké", "Daloa", "Yamoussoukro", "San-Pédro", "Korhogo", "Man", "Divo"],  # Variant
-    "british virgin islands": ["Road Town", "Spanish Town", "East End", "The Valley", "Great Harbour"],
-    "haiti": ["Port-au-Prince", "Carrefour", "Delmas", "Pétion-Ville", "Gonaïves", "Cap-Haïtien", "Saint-Marc", "Les Cayes"],
-    "kenya": ["Nairobi", "Mombasa", "Kisumu", "Nakuru", "Eldoret", "Thika", "Malindi", "Kitale"],
-    "monaco": ["Monaco", "Monte Carlo", "Fontvieille"],
-    "mozambique": ["Maputo", "Matola", "Beira", "Nampula", "Chimoio", "Nacala", "Quelimane", "Tete"],
-    "namibia": ["Windhoek", "Rundu", "Walvis Bay", "Oshakati", "Swakopmund", "Katima Mulilo", "Grootfontein", "Mariental"],
-    "nigeria": ["Lagos", "Kano", "Ibadan", "Abuja", "Port Harcourt", "Benin City", "Kaduna", "Maiduguri"],
-    "south africa": ["Johannesburg", "Cape Town", "Durban", "Pretoria", "Port Elizabeth", "Bloemfontein", "East London", "Polokwane"],
-    "myanmar": ["Yangon", "Mandalay", "Naypyidaw", "Mawlamyine", "Taunggyi", "Monywa", "Sittwe", "Pathein"],
-    "burma": ["Yangon", "Mandalay", "Naypyidaw", "Mawlamyine", "Taunggyi", "Monywa", "Sittwe", "Pathein"],  # Variant
-    "laos": ["Vientiane", "Savannakhet", "Pakse", "Luang Prabang", "Phonsavan", "Thakhek", "Xam Neua", "Muang Xay"],
-    "nepal": ["Kathmandu", "Pokhara", "Patan", "Biratnagar", "Birgunj", "Dharan", "Bharatpur", "Janakpur"],
-    "vietnam": ["Ho Chi Minh City", "Hanoi", "Da Nang", "Haiphong", "Can Tho", "Hue", "Nha Trang", "Quy Nhon"],
+    "cuba": ("Havana", "Santiago de Cuba", "Camagüey", "Holguín", "Santa Clara", "Guantánamo", "Bayamo", "Cienfuegos"),
+    "venezuela": ("Caracas", "Maracaibo", "Valencia", "Barquisimeto", "Ciudad Guayana", "Mérida", "San Cristóbal", "Barinas"),
+    "south sudan": ("Juba", "Malakal", "Wau", "Yei", "Bentiu", "Aweil", "Rumbek", "Torit"),
+    "central african republic": ("Bangui", "Bimbo", "Berbérati", "Carnot", "Bambari", "Bouar", "Bossangoa", "Bria"),
+    "democratic republic of the congo": _DRC_CITIES,
+    "democratic republic of the": _DRC_CITIES,  # Variant
+    "mali": ("Bamako", "Sikasso", "Mopti", "Koutiala", "Kayes", "Ségou", "Gao", "Timbuktu"),
+    "nicaragua": ("Managua", "León", "Granada", "Masaya", "Matagalpa", "Chinandega", "Estelí", "Jinotega"),
+    "angola": ("Luanda", "Huambo", "Lobito", "Benguela", "Kuito", "Lubango", "Malanje", "Namibe"),
+    "bolivia": ("La Paz", "Santa Cruz", "Cochabamba", "Sucre", "Oruro", "Tarija", "Potosí", "Trinidad"),
+    "burkina faso": ("Ouagadougou", "Bobo-Dioulasso", "Koudougou", "Ouahigouya", "Banfora", "Dédougou", "Kaya", "Tenkodogo"),
+    "cameroon": ("Douala", "Yaoundé", "Garoua", "Bafoussam", "Bamenda", "Maroua", "Kribi", "Buea"),
+    "ivory coast": _IVORY_COAST_CITIES,
+    "côte d'ivoire": _IVORY_COAST_CITIES,  # Variant
+    "cote d'ivoire": _IVORY_COAST_CITIES,  # Variant
+    "british virgin islands": ("Road Town", "Spanish Town", "East End", "The Valley", "Great Harbour"),
+    "haiti": ("Port-au-Prince", "Carrefour", "Delmas", "Pétion-Ville", "Gonaïves", "Cap-Haïtien", "Saint-Marc", "Les Cayes"),
+    "kenya": ("Nairobi", "Mombasa", "Kisumu", "Nakuru", "Eldoret", "Thika", "Malindi", "Kitale"),
+    "monaco": ("Monaco", "Monte Carlo", "Fontvieille"),
+    "mozambique": ("Maputo", "Matola", "Beira", "Nampula", "Chimoio", "Nacala", "Quelimane", "Tete"),
+    "namibia": ("Windhoek", "Rundu", "Walvis Bay", "Oshakati", "Swakopmund", "Katima Mulilo", "Grootfontein", "Mariental"),
+    "nigeria": ("Lagos", "Kano", "Ibadan", "Abuja", "Port Harcourt", "Benin City", "Kaduna", "Maiduguri"),
+    "south africa": ("Johannesburg", "Cape Town", "Durban", "Pretoria", "Port Elizabeth", "Bloemfontein", "East London", "Polokwane"),
+    "myanmar": _MYANMAR_CITIES,
+    "burma": _MYANMAR_CITIES,  # Variant
+    "laos": ("Vientiane", "Savannakhet", "Pakse", "Luang Prabang", "Phonsavan", "Thakhek", "Xam Neua", "Muang Xay"),
+    "nepal": ("Kathmandu", "Pokhara", "Patan", "Biratnagar", "Birgunj", "Dharan", "Bharatpur", "Janakpur"),
+    "vietnam": ("Ho Chi Minh City", "Hanoi", "Da Nang", "Haiphong", "Can Tho", "Hue", "Nha Trang", "Quy Nhon"),
     
     # Arabic script countries
-    "iran": ["Tehran", "Mashhad", "Isfahan", "Karaj", "Shiraz", "Tabriz", "Qom", "Ahvaz"],
-    "afghanistan": ["Kabul", "Kandahar", "Herat", "Mazar-i-Sharif", "Jalalabad", "Kunduz", "Ghazni", "Balkh"],
-    "sudan": ["Khartoum", "Omdurman", "Port Sudan", "Kassala", "El Geneina", "Nyala", "Al-Fashir", "Kosti"],
-    "iraq": ["Baghdad", "Basra", "Mosul", "Erbil", "Najaf", "Karbala", "Kirkuk", "Ramadi"],
-    "lebanon": ["Beirut", "Tripoli", "Sidon", "Tyre", "Zahle", "Byblos", "Baalbek", "Jounieh"],
-    "libya": ["Tripoli", "Benghazi", "Misrata", "Bayda", "Zawiya", "Ajdabiya", "Tobruk", "Sabha"],
-    "somalia": ["Mogadishu", "Hargeisa", "Kismayo", "Bosaso", "Baidoa", "Beledweyne", "Galkayo", "Garowe"],
-    "yemen": ["Sana'a", "Aden", "Ta'izz", "Hodeidah", "Ibb", "Dhamar", "Sayyan", "Zinjibar"],
-    "algeria": ["Algiers", "Oran", "Constantine", "Annaba", "Blida", "Batna", "Djelfa", "Sétif"],
-    "syria": ["Damascus", "Aleppo", "Homs", "Latakia", "Hama", "Tartus", "Deir ez-Zor", "Raqqa"],
+    "iran": ("Tehran", "Mashhad", "Isfahan", "Karaj", "Shiraz", "Tabriz", "Qom", "Ahvaz"),
+    "afghanistan": ("Kabul", "Kandahar", "Herat", "Mazar-i-Sharif", "Jalalabad", "Kunduz", "Ghazni", "Balkh"),
+    "sudan": ("Khartoum", "Omdurman", "Port Sudan", "Kassala", "El Geneina", "Nyala", "Al-Fashir", "Kosti"),
+    "iraq": ("Baghdad", "Basra", "Mosul", "Erbil", "Najaf", "Karbala", "Kirkuk", "Ramadi"),
+    "lebanon": ("Beirut", "Tripoli", "Sidon", "Tyre", "Zahle", "Byblos", "Baalbek", "Jounieh"),
+    "libya": ("Tripoli", "Benghazi", "Misrata", "Bayda", "Zawiya", "Ajdabiya", "Tobruk", "Sabha"),
+    "somalia": ("Mogadishu", "Hargeisa", "Kismayo", "Bosaso", "Baidoa", "Beledweyne", "Galkayo", "Garowe"),
+    "yemen": ("Sana'a", "Aden", "Ta'izz", "Hodeidah", "Ibb", "Dhamar", "Sayyan", "Zinjibar"),
+    "algeria": ("Algiers", "Oran", "Constantine", "Annaba", "Blida", "Batna", "Djelfa", "Sétif"),
+    "syria": ("Damascus", "Aleppo", "Homs", "Latakia", "Hama", "Tartus", "Deir ez-Zor", "Raqqa"),
     
     # CJK script countries
-    "north korea": ["Pyongyang", "Hamhung", "Chongjin", "Nampo", "Wonsan", "Sinuiju", "Tanchon", "Kaechon"],
+    "north korea": ("Pyongyang", "Hamhung", "Chongjin", "Nampo", "Wonsan", "Sinuiju", "Tanchon", "Kaechon"),
     
     # Cyrillic script countries
-    "russia": ["Moscow", "Saint Petersburg", "Novosibirsk", "Yekaterinburg", "Kazan", "Nizhny Novgorod", "Chelyabinsk", "Samara"],
-    "crimea": ["Simferopol", "Sevastopol", "Yalta", "Kerch", "Feodosia", "Evpatoria", "Bakhchisaray", "Sudak"],
-    "donetsk": ["Donetsk", "Mariupol", "Makiivka", "Horlivka", "Kramatorsk", "Sloviansk", "Bakhmut", "Pokrovsk"],
-    "luhansk": ["Luhansk", "Alchevsk", "Sievierodonetsk", "Lysychansk", "Stakhanov", "Krasnyi Luch", "Antratsyt", "Pervomaisk"],
-    "belarus": ["Minsk", "Gomel", "Mogilev", "Vitebsk", "Grodno", "Brest", "Bobruisk", "Baranavichy"],
-    "bulgaria": ["Sofia", "Plovdiv", "Varna", "Burgas", "Ruse", "Stara Zagora", "Pleven", "Sliven"],
-    "ukraine": ["Kyiv", "Kharkiv", "Odesa", "Dnipro", "Donetsk", "Zaporizhzhia", "Lviv", "Kryvyi Rih"],
+    "russia": ("Moscow", "Saint Petersburg", "Novosibirsk", "Yekaterinburg", "Kazan", "Nizhny Novgorod", "Chelyabinsk", "Samara"),
+    "crimea": ("Simferopol", "Sevastopol", "Yalta", "Kerch", "Feodosia", "Evpatoria", "Bakhchisaray", "Sudak"),
+    "donetsk": ("Donetsk", "Mariupol", "Makiivka", "Horlivka", "Kramatorsk", "Sloviansk", "Bakhmut", "Pokrovsk"),
+    "luhansk": ("Luhansk", "Alchevsk", "Sievierodonetsk", "Lysychansk", "Stakhanov", "Krasnyi Luch", "Antratsyt", "Pervomaisk"),
+    "belarus": ("Minsk", "Gomel", "Mogilev", "Vitebsk", "Grodno", "Brest", "Bobruisk", "Baranavichy"),
+    "bulgaria": ("Sofia", "Plovdiv", "Varna", "Burgas", "Ruse", "Stara Zagora", "Pleven", "Sliven"),
+    "ukraine": ("Kyiv", "Kharkiv", "Odesa", "Dnipro", "Donetsk", "Zaporizhzhia", "Lviv", "Kryvyi Rih"),
     
     # Additional common variations
-    "republic of the congo": ["Brazzaville", "Pointe-Noire", "Dolisie", "Nkayi", "Ouesso", "Owando"],
-    "the netherlands": ["Amsterdam", "Rotterdam", "The Hague", "Utrecht", "Eindhoven", "Groningen", "Tilburg", "Almere"],
-    "netherlands": ["Amsterdam", "Rotterdam", "The Hague", "Utrecht", "Eindhoven", "Groningen", "Tilburg", "Almere"],
-    "holland": ["Amsterdam", "Rotterdam", "The Hague", "Utrecht", "Eindhoven", "Groningen", "Tilburg", "Almere"],
-    "south korea": ["Seoul", "Busan", "Incheon", "Daegu", "Daejeon", "Gwangju", "Ulsan", "Seongnam"],
-    "gambia": ["Banjul", "Serekunda", "Brikama", "Bakau", "Farafenni", "Lamin", "Sukuta", "Basse Santa Su"],
-    "the gambia": ["Banjul", "Serekunda", "Brikama", "Bakau", "Farafenni", "Lamin", "Sukuta", "Basse Santa Su"],
-    "united arab emirates": ["Dubai", "Abu Dhabi", "Sharjah", "Al Ain", "Ajman", "Ras Al Khaimah", "Fujairah", "Umm Al Quwain"],
-    "uae": ["Dubai", "Abu Dhabi", "Sharjah", "Al Ain", "Ajman", "Ras Al Khaimah", "Fujairah", "Umm Al Quwain"],
-    "united kingdom": ["London", "Birmingham", "Manchester", "Glasgow", "Liverpool", "Leeds", "Edinburgh", "Sheffield"],
-    "uk": ["London", "Birmingham", "Manchester", "Glasgow", "Liverpool", "Leeds", "Edinburgh", "Sheffield"],
-    "great britain": ["London", "Birmingham", "Manchester", "Glasgow", "Liverpool", "Leeds", "Edinburgh", "Sheffield"],
-    "britain": ["London", "Birmingham", "Manchester", "Glasgow", "Liverpool", "Leeds", "Edinburgh", "Sheffield"],
-    "united states": ["New York", "Los Angeles", "Chicago", "Houston", "Phoenix", "Philadelphia", "San Antonio", "San Diego"],
-    "usa": ["New York", "Los Angeles", "Chicago", "Houston", "Phoenix", "Philadelphia", "San Antonio", "San Diego"],
-    "us": ["New York", "Los Angeles", "Chicago", "Houston", "Phoenix", "Philadelphia", "San Antonio", "San Diego"],
+    "republic of the congo": ("Brazzaville", "Pointe-Noire", "Dolisie", "Nkayi", "Ouesso", "Owando"),
+    "the netherlands": _NETHERLANDS_CITIES,
+    "netherlands": _NETHERLANDS_CITIES,
+    "holland": _NETHERLANDS_CITIES,
+    "south korea": ("Seoul", "Busan", "Incheon", "Daegu", "Daejeon", "Gwangju", "Ulsan", "Seongnam"),
+    "gambia": _GAMBIA_CITIES,
+    "the gambia": _GAMBIA_CITIES,
+    "united arab emirates": _UAE_CITIES,
+    "uae": _UAE_CITIES,
+    "united kingdom": _UK_CITIES,
+    "uk": _UK_CITIES,
+    "great britain": _UK_CITIES,
+    "britain": _UK_CITIES,
+    "united states": _USA_CITIES,
+    "usa": _USA_CITIES,
+    "us": _USA_CITIES,
+}
+
+# WELL_KNOWN_CITIES plus long/official country names, so get_fallback_cities needs
+# only dict lookups. This replaces a substring scan over every key, which also
+# misrouted names containing a short key (e.g. "australia" or "cyprus" -> "us").
+_WELL_KNOWN_ALIASES = {
+    **WELL_KNOWN_CITIES,
+    "russian federation": WELL_KNOWN_CITIES["russia"],
+    "syrian arab republic": WELL_KNOWN_CITIES["syria"],
+    "islamic republic of iran": WELL_KNOWN_CITIES["iran"],
+    "iran, islamic republic of": WELL_KNOWN_CITIES["iran"],
+    "republic of iraq": WELL_KNOWN_CITIES["iraq"],
+    "republic of cuba": WELL_KNOWN_CITIES["cuba"],
+    "bolivarian republic of venezuela": WELL_KNOWN_CITIES["venezuela"],
+    "venezuela, bolivarian republic of": WELL_KNOWN_CITIES["venezuela"],
+    "plurinational state of bolivia": WELL_KNOWN_CITIES["bolivia"],
+    "bolivia, plurinational state of": WELL_KNOWN_CITIES["bolivia"],
+    "democratic people's republic of korea": WELL_KNOWN_CITIES["north korea"],
+    "korea, democratic people's republic of": WELL_KNOWN_CITIES["north korea"],
+    "republic of korea": WELL_KNOWN_CITIES["south korea"],
+    "korea, republic of": WELL_KNOWN_CITIES["south korea"],
+    "lao people's democratic republic": WELL_KNOWN_CITIES["laos"],
+    "viet nam": WELL_KNOWN_CITIES["vietnam"],
+    "socialist republic of vietnam": WELL_KNOWN_CITIES["vietnam"],
+    "republic of the union of myanmar": WELL_KNOWN_CITIES["myanmar"],
+    "congo": WELL_KNOWN_CITIES["democratic republic of the congo"],  # Same default as _address
+    "congo, the democratic republic of the": WELL_KNOWN_CITIES["democratic republic of the congo"],
+    "republic of the sudan": WELL_KNOWN_CITIES["sudan"],
+    "republic of south sudan": WELL_KNOWN_CITIES["south sudan"],
+    "republic of belarus": WELL_KNOWN_CITIES["belarus"],
+    "republic of yemen": WELL_KNOWN_CITIES["yemen"],
+    "state of libya": WELL_KNOWN_CITIES["libya"],
+    "federal republic of somalia": WELL_KNOWN_CITIES["somalia"],
+    "federal republic of nigeria": WELL_KNOWN_CITIES["nigeria"],
+    "republic of south africa": WELL_KNOWN_CITIES["south africa"],
+    "united states of america": WELL_KNOWN_CITIES["united states"],
+    "united kingdom of great britain and northern ireland": WELL_KNOWN_CITIES["united kingdom"],
+    "kingdom of the netherlands": WELL_KNOWN_CITIES["netherlands"],
+    "republic of the gambia": WELL_KNOWN_CITIES["gambia"],
+    "principality of monaco": WELL_KNOWN_CITIES["monaco"],
 }
 
-def get_fallback_cities(country_name: str) -> List[str]:
+# Geonames fallback cities per country code, shared by every spelling of a country
+_fallback_cities_by_code: Dict[str, Tuple[str, ...]] = {}
+
+@lru_cache(maxsize=1024)
+def get_fallback_cities(country_name: str) -> Tuple[str, ...]:
     """
     Get fallback cities for a country when geonamescache fails.
     
@@ -260,66 +471,93 @@ def get_fallback_cities(country_name: str) -> List[str]:
     2. If not found, try geonamescache directly (should work for most countries)
     3. If geonamescache also fails, return empty list (will use country name extraction)
     
-    Returns empty list if no fallback cities available.
+    Returns empty tuple if no fallback cities available.
+    Results are cached and shared between callers, so they are immutable.
     """
-    country_lower = country_name.lower().strip()
-    normalized = normalize_country_name(country_name)
-    
-    # Strategy 1: Try WELL_KNOWN_CITIES database first (for sanctioned countries)
-    # Try normalized name first
-    if normalized in WELL_KNOWN_CITIES:
-        return WELL_KNOWN_CITIES[normalized]
-    
-    # Try original name
-    if country_lower in WELL_KNOWN_CITIES:
-        return WELL_KNOWN_CITIES[country_lower]
+    country = resolve_country(country_name)
+    country_lower = _name_key(country_name)
+    normalized = country.normalized
     
-    # Try partial match for long country names
-    for key, cities in WELL_KNOWN_CITIES.items():
-        if country_lower in key or key in country_lower:
+    # Strategy 1: Try WELL_KNOWN_CITIES database first (for sanctioned countries),
+    # normalized name first, then the original name (also covers long/official forms)
+    for key in (normalized, country_lower):
+        cities = _WELL_KNOWN_ALIASES.get(key)
+        if cities:
             return cities
     
     # Strategy 2: Try geonamescache directly as fallback (for valid countries)
     # This should work for most countries from geonamescache
     if GEONAMESCACHE_AVAILABLE:
         try:
-            cities, countries = get_geonames_data()
-            
-            # Find country code
-            country_code = None
-            for code, data in countries.items():
-                if data.get('name', '').lower().strip() == normalized:
-                    country_code = code
-                    break
-                if data.get('name', '').lower().strip() == country_lower:
-                    country_code = code
-                    break
-            
+            country_code = resolve_country(normalized).code or country.code
             if country_code:
-                # Get cities for this country
-                country_cities = []
-                for city_id, city_data in cities.items():
-                    if city_data.get("countrycode", "") == country_code:
-                        city_name = city_data.get("name", "").strip()
-                        if city_name and len(city_name) > 2:  # Filter very short names
-                            country_cities.append(city_name)
-                
-                # Return up to 10 cities (should be enough)
+                country_cities = _fallback_cities_by_code.get(country_code)
+                if country_cities is None:
+                    # Remove duplicates (keeping geonames order) and filter very short names
+                    country_cities = dict.fromkeys(
+                        city_name.strip() for city_name in _cities_in(country_code)
+                    )
+                    # Keep up to 10 cities (should be enough)
+                    country_cities = tuple(city_name for city_name in country_cities if len(city_name) > 2)[:10]
+                    _fallback_cities_by_code[country_code] = country_cities
                 if country_cities:
-                    return list(set(country_cities))[:10]  # Remove duplicates and limit
+                    return country_cities
         except Exception:
             # If geonamescache lookup fails, continue to next strategy
-            pass
+            logger.debug("Geonames fallback lookup failed for %r", country_name, exc_info=True)
     
-    # Strategy 3: Return empty list (will use country name extraction as last resort)
-    return []
+    # Strategy 3: Return empty tuple (will use country name extraction as last resort)
+    return ()
 
 # ============================================================================
 # Real Address Generation - Hardcoded Database of Street Names
 # ============================================================================
 
+# Nominatim results per "city,country" key, for the life of the process
+_real_addresses_cache: Dict[str, List[str]] = {}
+
+_NOMINATIM_URL = "https://nominatim.openstreetmap.org/search"
+_NOMINATIM_HEADERS = {
+    "User-Agent": "MIID-Subnet-Miner/1.0 (https://github.com/yanezcompliance/MIID-subnet; miner@yanezcompliance.com)"
+}
+
+class _RateLimiter:
+    """Spaces out request start times across threads by a fixed interval."""
+    
+    def __init__(self, interval):
+        self.interval = interval
+        self._lock = threading.Lock()
+        self._next_time = 0.0
+    
+    def wait(self):
+        with self._lock:
+            now = time.monotonic()
+            delay = self._next_time - now
+            self._next_time = max(now, self._next_time) + self.interval
+        if delay > 0:
+            time.sleep(delay)
+
+# The one Nominatim limiter for the process (_address uses it too): one request per second
+_NOMINATIM_RATE_LIMITER = _RateLimiter(1.0)
+
+# requests.Session is not guaranteed thread-safe, so keep one per thread
+_session_local = threading.local()
+
+def _get_nominatim_session():
+    """Return this thread's keep-alive Nominatim session, creating it on first use."""
+    session = getattr(_session_local, "session", None)
+    if session is None:
+        session = requests.Session()
+        session.headers.update(_NOMINATIM_HEADERS)
+        # No automatic retries: they would resend outside _NOMINATIM_RATE_LIMITER
+        session.mount("https://", HTTPAdapter(pool_connections=1, pool_maxsize=4))
+        _session_local.session = session
+    return session
+
 # Load hardcoded database of real street names per country
 _real_street_names_db: Dict[str, List[str]] = {}
+# Lowercased keys, built with the database (first key wins, as in the old scan)
+_real_street_names_db_lower: Dict[str, List[str]] = {}
 _db_loaded = False
 
 def _load_street_names_database():
@@ -333,8 +571,8 @@ def _load_street_names_database():
         # Try to load from JSON file first
         db_path = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'real_street_names_db.json')
         if os.path.exists(db_path):
-            with open(db_path, 'r', encoding='utf-8') as f:
-                _real_street_names_db = json.load(f)
+            _real_street_names_db = _read_street_names_file(db_path)
+            _index_street_names_database()
             _db_loaded = True
             return _real_street_names_db
     except Exception:
@@ -342,13 +580,45 @@ def _load_street_names_database():
     
     # If file doesn't exist, use the inline database (defined below)
     _real_street_names_db = _INLINE_STREET_NAMES_DB
+    _index_street_names_database()
     _db_loaded = True
     return _real_street_names_db
 
+def _read_street_names_file(db_path: str) -> Dict[str, List[str]]:
+    """Read the street names JSON, via a pickled copy that is rebuilt when the JSON changes."""
+    pickle_path = os.path.splitext(db_path)[0] + '.pkl'
+    try:
+        if os.path.getmtime(pickle_path) >= os.path.getmtime(db_path):
+            with open(pickle_path, 'rb') as f:
+                return pickle.load(f)
+    except (OSError, EOFError, pickle.UnpicklingError):
+        pass
+    
+    # Read bytes: orjson parses them directly (and json.loads accepts UTF-8 bytes)
+    with open(db_path, 'rb') as f:
+        db = _json_loads(f.read())
+    
+    # Best effort: write atomically so a concurrent reader never sees a partial file
+    tmp_path = f"{pickle_path}.{os.getpid()}.tmp"
+    try:
+        with open(tmp_path, 'wb') as f:
+            pickle.dump(db, f, protocol=pickle.HIGHEST_PROTOCOL)
+        os.replace(tmp_path, pickle_path)
+    except OSError:
+        logger.debug("Could not cache street names database at %s", pickle_path, exc_info=True)
+    return db
+
+def _index_street_names_database():
+    """Rebuild the lowercased-key index for the loaded street names database."""
+    _real_street_names_db_lower.clear()
+    for key, streets in _real_street_names_db.items():
+        _real_street_names_db_lower.setdefault(key.lower(), streets)
+
 # Inline database of real street names (fallback if JSON file not available)
 # This is populated from real_street_names_db.json or generated on-demand
 _INLINE_STREET_NAMES_DB: Dict[str, List[str]] = {}
 
+@lru_cache(maxsize=1024)
 def get_real_street_names_for_country(country: str) -> List[str]:
     """
     Get real street names for a specific country from the hardcoded database.
@@ -372,13 +642,13 @@ def get_real_street_names_for_country(country: str) -> List[str]:
     
     # Try case-insensitive lookup
     country_lower = country.lower()
-    for key, streets in db.items():
-        if key.lower() == country_lower:
-            return streets
+    streets = _real_street_names_db_lower.get(country_lower)
+    if streets is not None:
+        return streets
     
     # Try partial match
-    for key, streets in db.items():
-        if country_lower in key.lower() or key.lower() in country_lower:
+    for key_lower, streets in _real_street_names_db_lower.items():
+        if country_lower in key_lower or key_lower in country_lower:
             return streets
     
     # Return empty list if not found (will use fallback)
@@ -412,51 +682,38 @@ def get_real_addresses_from_nominatim(city: str, country: str, limit: int = 20)
         # We'll accept results with place_rank >= 18 (neighborhood level or better)
         # This gives us more results while still being reasonably specific
         
-        url = "https://nominatim.openstreetmap.org/search"
-        headers = {
-            "User-Agent": "MIID-Subnet-Miner/1.0 (https://github.com/yanezcompliance/MIID-subnet; miner@yanezcompliance.com)"
-        }
+        session = _get_nominatim_session()
+        results = None
         
-        all_results = []
-        
-        # Try different query strategies
-        queries = [
-            f"{city}, {country}",  # Simple city, country (gets various places)
-        ]
+        params = {
+            "q": f"{city}, {country}",  # Simple city, country (gets various places)
+            "format": "json",
+            "limit": limit * 5,  # Fetch many results to filter
+            "addressdetails": 1,
+            "extratags": 1,
+            "namedetails": 1
+        }
         
-        for query in queries:
-            params = {
-                "q": query,
-                "format": "json",
-                "limit": limit * 5,  # Fetch many results to filter
-                "addressdetails": 1,
-                "extratags": 1,
-                "namedetails": 1
-            }
+        try:
+            # Rate limiting: at most one request per second across threads (Nominatim policy)
+            _NOMINATIM_RATE_LIMITER.wait()
+            response = session.get(_NOMINATIM_URL, params=params, timeout=10)
             
-            try:
-                response = requests.get(url, params=params, headers=headers, timeout=10)
-                
-                if response.status_code == 200:
-                    results = response.json()
-                    if results:
-                        all_results.extend(results)
-                
-                # Rate limiting: wait 1 second between queries
-                time.sleep(1.0)
-                break  # Only try first query for now
-            except Exception:
-                continue
+            if response.status_code == 200:
+                results = _json_loads(response.content)
+        except Exception:
+            pass
         
-        if not all_results:
+        if not results:
             return []
         
         # Extract street names and format addresses
         real_addresses = []
-        seen_addresses = set()
+        seen_addresses = set()  # normalized addresses
         seen_roads = set()  # Track unique road names
         
-        for result in all_results:
+        # Filter straight off the response and stop once limit addresses are found
+        for result in results:
             # Accept street-level, building-level, or neighborhood-level results
             # place_rank >= 18 includes neighborhoods, streets, and buildings
             place_rank = result.get('place_rank', 0)
@@ -467,36 +724,29 @@ def get_real_addresses_from_nominatim(city: str, country: str, limit: int = 20)
             display_name = result.get('display_name', '')
             address_details = result.get('address', {})
             
-            # Try to extract street/road name from various fields
-            road = (
-                address_details.get('road', '') or
-                address_details.get('street', '') or
-                address_details.get('street_name', '') or
-                address_details.get('residential', '') or
-                address_details.get('pedestrian', '') or
-                address_details.get('path', '')
-            )
+            # Try to extract street/road name from various fields (first non-empty wins)
+            road = ''
+            for road_key in _ROAD_KEYS:
+                road = address_details.get(road_key)
+                if road:
+                    break
             
             # Also check result type - if it's a highway/road, use the name
-            result_type = result.get('type', '')
-            result_class = result.get('class', '')
-            if (result_class == 'highway' or result_type in ['residential', 'primary', 'secondary', 'tertiary', 'unclassified']) and not road:
+            if not road and (result.get('class') == 'highway' or result.get('type') in _HIGHWAY_TYPES):
                 # Use the name field if it's a road
                 road = result.get('name', '')
             
             # Fallback: try to extract from display_name
             if not road and display_name:
-                parts = display_name.split(',')
-                if len(parts) > 0:
-                    first_part = parts[0].strip()
-                    # Check if first part looks like a street name (not a number, not too short)
-                    if len(first_part) > 3 and not first_part.replace(' ', '').isdigit():
-                        # Try to extract street name (might have number prefix)
-                        street_match = re.match(r'^(\d+)\s+(.+?)$', first_part)
-                        if street_match:
-                            road = street_match.group(2).strip()
-                        elif 'street' in first_part.lower() or 'road' in first_part.lower() or 'avenue' in first_part.lower():
-                            road = first_part
+                first_part = display_name.partition(',')[0].strip()
+                # Check if first part looks like a street name (not a number, not too short)
+                if len(first_part) > 3 and not first_part.replace(' ', '').isdigit():
+                    # Try to extract street name (might have number prefix)
+                    street_match = _STREET_NUM_RE.match(first_part)
+                    if street_match:
+                        road = street_match.group(2).strip()
+                    elif 'street' in first_part.lower() or 'road' in first_part.lower() or 'avenue' in first_part.lower():
+                        road = first_part
             
             # If we have a road/street name, format the address
             if road and len(road) > 2 and road.lower() not in seen_roads:
@@ -506,7 +756,7 @@ def get_real_addresses_from_nominatim(city: str, country: str, limit: int = 20)
                 house_number = address_details.get('house_number', '')
                 if not house_number and display_name:
                     # Try to extract number from display_name
-                    number_match = re.search(r'\b(\d+)\b', display_name.split(',')[0])
+                    number_match = _NUM_IN_FIRST_RE.search(display_name.partition(',')[0])
                     if number_match:
                         house_number = number_match.group(1)
                 
@@ -528,16 +778,98 @@ def get_real_addresses_from_nominatim(city: str, country: str, limit: int = 20)
         # Cache the results (even if empty, to avoid repeated failed queries)
         _real_addresses_cache[cache_key] = real_addresses
         
-        # Rate limiting: wait 1 second after API call (Nominatim policy)
-        time.sleep(1.0)
-        
         return real_addresses
         
     except Exception as e:
         # On error, return empty list (will fallback to generic addresses)
-        print(f"⚠️  Warning: Failed to fetch real addresses from Nominatim for {city}, {country}: {str(e)}")
+        _warn_once(f"nominatim:{city},{country}",
+                   "Failed to fetch real addresses from Nominatim for %s, %s: %s", city, country, e)
         return []
 
+def _fast_validate(city_name: str, normalized_country: str) -> bool:
+    """
+    Same answer as validate_city_in_country, but exact geonames names are
+    answered from the country's name set without taking an lru_cache slot
+    (the pool filters below would otherwise evict every other entry).
+    """
+    if city_name and _name_key(city_name) in resolve_country(normalized_country).city_set:
+        return True
+    return validate_city_in_country(city_name, normalized_country)
+
+@lru_cache(maxsize=256)
+def _validated_city_pool(normalized_country: str, original_country: str) -> Tuple[str, ...]:
+    """
+    Cities to draw from for a country: geonames cities that pass the validator's
+    city check, then fallback cities, then a name derived from the country.
+    Cached per country since the city data is static.
+    """
+    # Get all cities for this country and filter to only validated ones
+    all_cities = get_cities_for_country(normalized_country)
+    # Filter to only cities that pass validator's city_in_country check
+    city_pool = tuple(city for city in all_cities if _fast_validate(city, normalized_country))
+    if city_pool:
+        return city_pool
+    
+    # If no validated cities found, try fallback cities from well-known database
+    fallback_cities = get_fallback_cities(original_country)
+    if fallback_cities:
+        # Try to validate fallback cities against geonamescache
+        validated_fallbacks = tuple(city for city in fallback_cities if _fast_validate(city, normalized_country))
+        # Use fallback cities even if not validated (better than "City")
+        return validated_fallbacks or fallback_cities
+    
+    # Last resort: try to use first word of country name or a generic name
+    # Extract a meaningful word from country name instead of "City"
+    # Use first significant word (skip "the", "of", etc.)
+    significant_words = [w for w in normalized_country.split() if w.lower() not in _COUNTRY_STOPWORDS]
+    if significant_words:
+        return (significant_words[0].capitalize(),)
+    return ("City",)  # Absolute last resort
+
+@lru_cache(maxsize=512)
+def _resolve_city_pool(seed_city: Optional[str], normalized_country: str, original_country: str) -> Tuple[str, ...]:
+    """City pool for an address: the seed city if the validator accepts it, else the country's pool."""
+    if seed_city and _fast_validate(seed_city, normalized_country):
+        # If seed city is valid, use it
+        return (seed_city,)
+    return _validated_city_pool(normalized_country, original_country)
+
+def _parse_seed(address: str) -> Tuple[Optional[str], str]:
+    """
+    Split a seed address into (seed city, country) without building a parts list.
+    "City, ..., Country" gives the first and last fields (country kept exactly as
+    written); with no comma the validator sent just a country name.
+    """
+    first_comma = address.find(',')
+    if first_comma < 0:
+        return None, address.strip() or "Unknown"
+    return address[:first_comma].strip(), address[address.rfind(',') + 1:].strip()
+
+# Random draws _pick_city tries before building the full validated pool
+_CITY_DRAW_ATTEMPTS = 8
+
+def _pick_city(seed_city: Optional[str], normalized_country: str, original_country: str) -> str:
+    """
+    One random city for an address, distributed as random.choice over the
+    _resolve_city_pool result. Validates a few random geonames cities first,
+    so a single city rarely costs the full per-country filter.
+    """
+    if seed_city and _fast_validate(seed_city, normalized_country):
+        return seed_city
+    all_cities = get_cities_for_country(normalized_country)
+    if all_cities:
+        for _ in range(_CITY_DRAW_ATTEMPTS):
+            candidate = random.choice(all_cities)
+            if _fast_validate(candidate, normalized_country):
+                return candidate
+    return random.choice(_validated_city_pool(normalized_country, original_country))
+
+# Generic streets for countries missing from the street names database
+_GENERIC_STREET_NAMES = ("Main St", "Oak Ave", "Park Rd", "Elm St", "First Ave",
+                         "Second St", "Broadway", "Washington Ave", "Lincoln St")
+_BUILDING_NUMBERS = range(1, 999)
+_APARTMENT_NUMBERS = range(1, 1000)
+
 def generate_address_variations(address: str, count: int = 15) -> List[str]:
     """
     Generate address variations - uses real city names from geonamescache when available.
@@ -546,56 +878,13 @@ def generate_address_variations(address: str, count: int = 15) -> List[str]:
     validator's extract_city_country and city_in_country checks (Address Regain Match score).
     """
     # Extract city/country from address - preserve EXACT country name format
-    parts = address.split(',')
-    original_country = None
-    seed_city = None
-    
-    if len(parts) >= 2:
-        # Has comma: "City, Country" format
-        seed_city = parts[0].strip()
-        original_country = parts[-1].strip()  # Preserve EXACT country name format
-    else:
-        # No comma: validator sent just country name
-        original_country = address.strip() if address.strip() else "Unknown"
+    seed_city, original_country = _parse_seed(address)
     
     # Normalize country name for geonamescache lookup (validator does this too)
     normalized_country = normalize_country_name(original_country)
     
     # Get cities for this country - BUT validate they exist in geonamescache
-    if seed_city and validate_city_in_country(seed_city, normalized_country):
-        # If seed city is valid, use it
-        city_pool = [seed_city]
-    else:
-        # Get all cities for this country and filter to only validated ones
-        all_cities = get_cities_for_country(normalized_country)
-        # Filter to only cities that pass validator's city_in_country check
-        city_pool = [city for city in all_cities if validate_city_in_country(city, normalized_country)]
-        
-        # If no validated cities found, try fallback cities from well-known database
-        if not city_pool:
-            fallback_cities = get_fallback_cities(original_country)
-            if fallback_cities:
-                # Try to validate fallback cities against geonamescache
-                validated_fallbacks = [city for city in fallback_cities if validate_city_in_country(city, normalized_country)]
-                if validated_fallbacks:
-                    city_pool = validated_fallbacks
-                else:
-                    # Use fallback cities even if not validated (better than "City")
-                    city_pool = fallback_cities
-            else:
-                # Last resort: try to use first word of country name or a generic name
-                # Extract a meaningful word from country name instead of "City"
-                country_words = normalized_country.split()
-                if len(country_words) > 0:
-                    # Use first significant word (skip "the", "of", etc.)
-                    significant_words = [w for w in country_words if w.lower() not in ["the", "of", "and", "republic", "democratic"]]
-                    if significant_words:
-                        fallback_name = significant_words[0].capitalize()
-                        city_pool = [fallback_name]
-                    else:
-                        city_pool = ["City"]  # Absolute last resort
-                else:
-                    city_pool = ["City"]  # Absolute last resort
+    city_pool = _resolve_city_pool(seed_city, normalized_country, original_country)
     
     variations = []
     used = set()
@@ -603,113 +892,189 @@ def generate_address_variations(address: str, count: int = 15) -> List[str]:
     # Get real street names from hardcoded database for this country
     real_street_names = get_real_street_names_for_country(normalized_country)
     
-    # Determine if we should use real street names or fallback to generic
-    has_real_streets = len(real_street_names) > 0
+    # Use real street names when the database has this country, generic ones otherwise
+    street_names = real_street_names or _GENERIC_STREET_NAMES
     
-    if has_real_streets:
-        # Use real street names from hardcoded database
-        # Generate addresses: "number street, city, country"
-        building_numbers = list(range(1, 999))
-        
-        for i in range(count):
-            street = random.choice(real_street_names)
-            number = random.choice(building_numbers)
-            city = random.choice(city_pool)
-            
-            addr = f"{number} {street}, {city}, {normalized_country}"
-            
-            if addr not in used:
-                variations.append(addr)
-                used.add(addr)
-            else:
-                # Add apartment number if duplicate
-                apt = random.randint(1, 999)
-                addr = f"{number} {street}, Apt {apt}, {city}, {normalized_country}"
-                variations.append(addr)
-                used.add(addr)
-    else:
-        # Fallback to generic street names if database doesn't have this country
-        street_names = ["Main St", "Oak Ave", "Park Rd", "Elm St", "First Ave", 
-                        "Second St", "Broadway", "Washington Ave", "Lincoln St"]
-        building_numbers = list(range(1, 999))
-        
-        for i in range(count):
-            street = random.choice(street_names)
-            number = random.choice(building_numbers)
-            city = random.choice(city_pool)
-            
-            addr = f"{number} {street}, {city}, {normalized_country}"
-            
-            if addr not in used:
-                variations.append(addr)
-                used.add(addr)
-            else:
-                # Add apartment number if duplicate
-                apt = random.randint(1, 999)
-                addr = f"{number} {street}, Apt {apt}, {city}, {normalized_country}"
-                variations.append(addr)
-                used.add(addr)
+    # Generate addresses: "number street, city, country"
+    # Sample every axis up front: one RNG call per axis instead of one per variation
+    streets = random.choices(street_names, k=count)
+    numbers = random.choices(_BUILDING_NUMBERS, k=count)
+    cities = random.choices(city_pool, k=count)
+    apts = random.choices(_APARTMENT_NUMBERS, k=count)
+    # Joined once so each f-string below interpolates one value fewer
+    country_tail = ", " + normalized_country
+    
+    for street, number, city, apt in zip(streets, numbers, cities, apts):
+        # Dedupe on the components; str objects cache their hash, so this
+        # avoids hashing the formatted address
+        key = (number, street, city)
+        if key not in used:
+            used.add(key)
+            variations.append(f"{number} {street}, {city}{country_tail}")
+        else:
+            # Add apartment number if duplicate
+            variations.append(f"{number} {street}, Apt {apt}, {city}{country_tail}")
     
     return variations[:count]
 
+# Maps every ASCII non-alphanumeric to None so str.translate drops them in C
+_NON_ALNUM_TABLE = dict.fromkeys(i for i in range(128) if not chr(i).isalnum())
+
+def _alnum_len(text: str) -> int:
+    """Number of alphanumeric characters in text."""
+    if text.isascii():
+        return len(text.translate(_NON_ALNUM_TABLE))
+    return sum(1 for c in text if c.isalnum())
+
+# Approximate country centers for generate_uav_address coordinates
+# Comprehensive country database with geographic centers
+# These are rough approximations - in production, use geocoding API
+_COUNTRY_COORDS: Dict[str, Tuple[float, float]] = {
+    # North America
+    "USA": (39.8283, -98.5795), "United States": (39.8283, -98.5795),
+    "US": (39.8283, -98.5795), "United States of America": (39.8283, -98.5795),
+    "Canada": (56.1304, -106.3468), "Mexico": (23.6345, -102.5528),
+    # Central America & Caribbean
+    "Haiti": (18.9712, -72.2852), "Honduras": (15.2000, -86.2419),
+    "Cuba": (21.5218, -77.7812), "Jamaica": (18.1096, -77.2975),
+    "Guatemala": (15.7835, -90.2308), "Belize": (17.1899, -88.4976),
+    "El Salvador": (13.7942, -88.8965), "Nicaragua": (12.2650, -85.2072),
+    "Costa Rica": (9.7489, -83.7534), "Panama": (8.5380, -80.7821),
+    "Dominican Republic": (18.7357, -70.1627), "Puerto Rico": (18.2208, -66.5901),
+    # South America
+    "Brazil": (-14.2350, -51.9253), "Argentina": (-38.4161, -63.6167),
+    "Colombia": (4.5709, -74.2973), "Peru": (-9.1900, -75.0152),
+    "Venezuela": (6.4238, -66.5897), "Chile": (-35.6751, -71.5430),
+    "Ecuador": (-1.8312, -78.1834), "Bolivia": (-16.2902, -63.5887),
+    "Paraguay": (-23.4425, -58.4438), "Uruguay": (-32.5228, -55.7658),
+    # Europe
+    "UK": (54.7024, -3.2766), "United Kingdom": (54.7024, -3.2766),
+    "Britain": (54.7024, -3.2766), "Great Britain": (54.7024, -3.2766),
+    "Germany": (51.1657, 10.4515), "France": (46.2276, 2.2137),
+    "Spain": (40.4637, -3.7492), "Italy": (41.8719, 12.5674),
+    "Russia": (61.5240, 105.3188), "Poland": (51.9194, 19.1451),
+    "Netherlands": (52.1326, 5.2913), "Belgium": (50.5039, 4.4699),
+    "Greece": (39.0742, 21.8243), "Portugal": (39.3999, -8.2245),
+    "Sweden": (60.1282, 18.6435), "Norway": (60.4720, 8.4689),
+    "Denmark": (56.2639, 9.5018), "Finland": (61.9241, 25.7482),
+    "Switzerland": (46.8182, 8.2275), "Austria": (47.5162, 14.5501),
+    "Czech Republic": (49.8175, 15.4730), "Romania": (45.9432, 24.9668),
+    "Hungary": (47.1625, 19.5033), "Ukraine": (48.3794, 31.1656),
+    "Turkey": (38.9637, 35.2433), "Ireland": (53.4129, -8.2439),
+    # Asia
+    "China": (35.8617, 104.1954), "India": (20.5937, 78.9629),
+    "Japan": (36.2048, 138.2529), "South Korea": (35.9078, 127.7669),
+    "North Korea": (40.3399, 127.5101), "Thailand": (15.8700, 100.9925),
+    "Vietnam": (14.0583, 108.2772), "Philippines": (12.8797, 121.7740),
+    "Indonesia": (-0.7893, 113.9213), "Malaysia": (4.2105, 101.9758),
+    "Singapore": (1.3521, 103.8198), "Bangladesh": (23.6850, 90.3563),
+    "Pakistan": (30.3753, 69.3451), "Afghanistan": (33.9391, 67.7100),
+    "Iran": (32.4279, 53.6880), "Iraq": (33.2232, 43.6793),
+    "Saudi Arabia": (23.8859, 45.0792), "UAE": (23.4241, 53.8478),
+    "United Arab Emirates": (23.4241, 53.8478), "Israel": (31.0461, 34.8516),
+    "Lebanon": (33.8547, 35.8623), "Jordan": (30.5852, 36.2384),
+    "Syria": (34.8021, 38.9968), "Yemen": (15.5527, 48.5164),
+    # Africa
+    "Egypt": (26.8206, 30.8025), "Libya": (26.3351, 17.2283),
+    "Sudan": (12.8628, 30.2176), "Ethiopia": (9.1450, 38.7667),
+    "Kenya": (-0.0236, 37.9062), "Nigeria": (9.0820, 8.6753),
+    "South Africa": (-30.5595, 22.9375), "Ghana": (7.9465, -1.0232),
+    "Morocco": (31.7917, -7.0926), "Algeria": (28.0339, 1.6596),
+    "Tunisia": (33.8869, 9.5375), "Mauritius": (-20.3484, 57.5522),
+    "Gabon": (-0.8037, 11.6094), "Benin": (9.3077, 2.3158),
+    "Namibia": (-22.9576, 18.4904), "Papua New Guinea": (-6.3150, 143.9555),
+    # Additional sanctioned countries
+    "South Sudan": (6.8770, 31.3070), "Central African Republic": (6.6111, 20.9394),
+    "Democratic Republic of the Congo": (-4.0383, 21.7587), "DRC": (-4.0383, 21.7587),
+    "Congo, Democratic Republic of the": (-4.0383, 21.7587), "Mali": (17.5707, -3.9962),
+    "Angola": (-11.2027, 17.8739), "Burkina Faso": (12.2383, -1.5616),
+    "Cameroon": (7.3697, 12.3547), "Ivory Coast": (7.5400, -5.5471),
+    "Cote d'Ivoire": (7.5400, -5.5471), "British Virgin Islands": (18.4207, -64.6399),
+    "Monaco": (43.7384, 7.4246), "Mozambique": (-18.6657, 35.5296),
+    "Myanmar": (21.9162, 95.9560), "Laos": (19.8563, 102.4955),
+    "Nepal": (28.3949, 84.1240), "Somalia": (5.1521, 46.1996),
+    # Additional Cyrillic sanctioned regions
+    "Belarus": (53.7098, 27.9534), "Bulgaria": (42.7339, 25.4858),
+    "Crimea": (45.3388, 33.5000), "Donetsk": (48.0159, 37.8029),
+    "Luhansk": (48.5740, 39.3078),
+    # Oceania
+    "Australia": (-25.2744, 133.7751), "New Zealand": (-40.9006, 174.8860),
+    # Middle East (already listed above, keeping for organization)
+    "Kuwait": (29.3117, 47.4818), "Qatar": (25.3548, 51.1839),
+    "Bahrain": (25.9304, 50.6378), "Oman": (21.4735, 55.9754),
+}
+_COUNTRY_COORDS_LOWER = {key.lower(): coords for key, coords in _COUNTRY_COORDS.items()}
+
+@lru_cache(maxsize=512)
+def _resolve_coords(country_norm: str) -> Optional[Tuple[float, float]]:
+    """Center for a lowercased country name: exact match, then substring either way."""
+    coords = _COUNTRY_COORDS_LOWER.get(country_norm)
+    if coords is not None:
+        return coords
+    for country_key_lower, coords in _COUNTRY_COORDS_LOWER.items():
+        if country_key_lower in country_norm or country_norm in country_key_lower:
+            return coords
+    return None
+
+# UAV address templates as (format string, label); "{street:.25}" keeps the first 25 characters
+# CRITICAL: All options must have street name + city + country format
+# CRITICAL: All options must be >= 30 characters to pass validator validation
+_UAV_TEMPLATES = (
+    # Typo: "Str" instead of "St" or "Street" (use full street name)
+    ("{num} {street} Str, {city}, {country}", "Common typo (Str vs St)"),
+    # Abbreviation: "Av" instead of "Ave" or "Avenue" (use longer portion of street)
+    ("{num} {street:.25} Av, {city}, {country}", "Local abbreviation (Av vs Ave)"),
+    # Missing direction: "1st" prefix but missing street type (use full street)
+    ("{num} 1st {street}, {city}, {country}", "Missing street direction"),
+    # Abbreviated with period: "St." or "Av." (use full street)
+    ("{num} {street} St., {city}, {country}", "Abbreviated with period"),
+    # Missing space: street name merged with number (typo)
+    ("{num}{street:.15} Street, {city}, {country}", "Missing space after number"),
+)
+# Alphanumerics each _UAV_TEMPLATES entry adds to the street ("Str", "Av", "1st", "St", "Street"),
+# and how many street characters it keeps (None = all)
+_UAV_TEMPLATE_STREET_COSTS = ((3, None), (2, 25), (3, None), (2, None), (6, 15))
+
+@lru_cache(maxsize=256)
+def _uav_streets_by_min_alnum(normalized_country: str) -> Tuple[Tuple[int, ...], Tuple[str, ...]]:
+    """
+    The country's street names sorted by the fewest alphanumerics any UAV
+    template yields for them, with those minimums (for bisecting on the
+    length still needed after number, city and country).
+    """
+    ranked = sorted(
+        (min(extra + _alnum_len(street[:keep]) for extra, keep in _UAV_TEMPLATE_STREET_COSTS), street)
+        for street in get_real_street_names_for_country(normalized_country)
+    )
+    return tuple(m for m, _ in ranked), tuple(street for _, street in ranked)
+
+# Same variations for generic streets, truncated shorter
+_GENERIC_UAV_TEMPLATES = (
+    ("{num} {street} Str, {city}, {country}", "Common typo (Str vs St)"),
+    ("{num} {street:.15} Av, {city}, {country}", "Local abbreviation (Av vs Ave)"),
+    ("{num} 1st {street}, {city}, {country}", "Missing street direction"),
+    ("{num} {street} St., {city}, {country}", "Abbreviated with period"),
+    ("{num}{street:.10} Street, {city}, {country}", "Missing space after number"),
+)
+# Longer generic street names to ensure minimum length
+_GENERIC_UAV_STREETS = (
+    "Main Street", "Oak Avenue", "Elm Boulevard", "Park Drive", "First Avenue",
+    "Second Street", "Third Boulevard", "Washington Avenue", "Lincoln Street"
+)
+
 def generate_uav_address(address: str) -> Dict:
     """
     Generate UAV (Unknown Attack Vector) address that looks valid but might fail geocoding.
     Returns: dict with 'address', 'label', 'latitude', 'longitude'
     """
     # Extract city/country from address (same logic as generate_address_variations)
-    parts = address.split(',')
-    original_country = None
-    seed_city = None
-    
-    if len(parts) >= 2:
-        seed_city = parts[0].strip()
-        original_country = parts[-1].strip()
-    else:
-        # No comma: validator sent just country name
-        original_country = address.strip() if address.strip() else "Unknown"
+    seed_city, original_country = _parse_seed(address)
     
     # Normalize country name for geonamescache lookup (same as generate_address_variations)
     normalized_country = normalize_country_name(original_country)
     
-    # Get cities for this country - BUT validate they exist in geonamescache
-    if seed_city and validate_city_in_country(seed_city, normalized_country):
-        # If seed city is valid, use it
-        city_pool = [seed_city]
-    else:
-        # Get all cities for this country and filter to only validated ones
-        all_cities = get_cities_for_country(normalized_country)
-        # Filter to only cities that pass validator's city_in_country check
-        city_pool = [city for city in all_cities if validate_city_in_country(city, normalized_country)]
-        
-        # If no validated cities found, try fallback cities from well-known database
-        if not city_pool:
-            fallback_cities = get_fallback_cities(original_country)
-            if fallback_cities:
-                # Try to validate fallback cities against geonamescache
-                validated_fallbacks = [city for city in fallback_cities if validate_city_in_country(city, normalized_country)]
-                if validated_fallbacks:
-                    city_pool = validated_fallbacks
-                else:
-                    # Use fallback cities even if not validated (better than "City")
-                    city_pool = fallback_cities
-            else:
-                # Last resort: try to use first word of country name or a generic name
-                # Extract a meaningful word from country name instead of "City"
-                country_words = normalized_country.split()
-                if len(country_words) > 0:
-                    # Use first significant word (skip "the", "of", etc.)
-                    significant_words = [w for w in country_words if w.lower() not in ["the", "of", "and", "republic", "democratic"]]
-                    if significant_words:
-                        fallback_name = significant_words[0].capitalize()
-                        city_pool = [fallback_name]
-                    else:
-                        city_pool = ["City"]  # Absolute last resort
-                else:
-                    city_pool = ["City"]  # Absolute last resort
-    
-    # Select a random city from the pool
-    city = random.choice(city_pool)
+    # Pick a city for this country - BUT validate it exists in geonamescache
+    city = _pick_city(seed_city, normalized_country, original_country)
     
     # Get real street names from hardcoded database for this country
     real_street_names = get_real_street_names_for_country(normalized_country)
@@ -721,44 +1086,23 @@ def generate_uav_address(address: str) -> Dict:
     if real_street_names:
         # Use a real street name as base and modify it to create a UAV (typo, abbreviation, etc.)
         # CRITICAL: Ensure street name is long enough to meet 30-char minimum
-        # Try multiple street names until we find one that works
-        max_attempts = 10
-        uav_address = None
-        label = None
+        # Only draw from streets that reach it under every template, so no retries are needed
+        street_mins, streets = _uav_streets_by_min_alnum(normalized_country)
+        needed = 30 - _alnum_len(f"{num}{city}{normalized_country}")
+        first_safe = bisect_left(street_mins, needed)
         
-        for attempt in range(max_attempts):
-            street = random.choice(real_street_names)
-            
-            # Create UAV variations from real street name
-            # CRITICAL: All options must have street name + city + country format
-            # CRITICAL: All options must be >= 30 characters to pass validator validation
-            uav_options = [
-                # Typo: "Str" instead of "St" or "Street" (use full street name)
-                (f"{num} {street} Str, {city}, {normalized_country}", "Common typo (Str vs St)"),
-                # Abbreviation: "Av" instead of "Ave" or "Avenue" (use longer portion of street)
-                (f"{num} {street[:25] if len(street) > 25 else street} Av, {city}, {normalized_country}", "Local abbreviation (Av vs Ave)"),
-                # Missing direction: "1st" prefix but missing street type (use full street)
-                (f"{num} 1st {street}, {city}, {normalized_country}", "Missing street direction"),
-                # Abbreviated with period: "St." or "Av." (use full street)
-                (f"{num} {street} St., {city}, {normalized_country}", "Abbreviated with period"),
-                # Missing space: street name merged with number (typo)
-                (f"{num}{street[:15]} Street, {city}, {normalized_country}", "Missing space after number"),
-            ]
-            candidate_address, candidate_label = random.choice(uav_options)
+        if first_safe < len(streets):
+            street = streets[random.randrange(first_safe, len(streets))]
             
-            # Check if address is at least 30 characters (validator requirement)
-            addr_len = len(''.join(c for c in candidate_address if c.isalnum()))
-            if addr_len >= 30:
-                uav_address = candidate_address
-                label = candidate_label
-                break
-        
-        # Final fallback: if still too short, use longest street name available
-        if uav_address is None or len(''.join(c for c in uav_address if c.isalnum())) < 30:
+            # Create a UAV variation from the real street name, formatting only the chosen template
+            template, label = random.choice(_UAV_TEMPLATES)
+            uav_address = template.format(num=num, street=street, city=city, country=normalized_country)
+        else:
+            # Final fallback: no street is long enough, use longest street name available
             longest_street = max(real_street_names, key=len)
             # Ensure minimum length by adding city details or using longer format
             base_address = f"{num} {longest_street} Str, {city}, {normalized_country}"
-            addr_len = len(''.join(c for c in base_address if c.isalnum()))
+            addr_len = _alnum_len(base_address)
             if addr_len < 30:
                 # Add more details to reach 30 chars minimum
                 uav_address = f"{num} {longest_street} Street Str, {city}, {normalized_country}"
@@ -767,115 +1111,25 @@ def generate_uav_address(address: str) -> Dict:
             label = "Common typo (Str vs St)"
     else:
         # Fallback to generic if no real street names available from database
-        # CRITICAL: All options must have street name + city + country format
-        # CRITICAL: All options must be >= 30 characters to pass validator validation
-        # Use longer generic street names to ensure minimum length
-        generic_street_options = [
-            "Main Street", "Oak Avenue", "Elm Boulevard", "Park Drive", "First Avenue",
-            "Second Street", "Third Boulevard", "Washington Avenue", "Lincoln Street"
-        ]
-        street = random.choice(generic_street_options)
+        street = random.choice(_GENERIC_UAV_STREETS)
         
-        uav_options = [
-            (f"{num} {street} Str, {city}, {normalized_country}", "Common typo (Str vs St)"),
-            (f"{num} {street[:15]} Av, {city}, {normalized_country}", "Local abbreviation (Av vs Ave)"),
-            (f"{num} 1st {street}, {city}, {normalized_country}", "Missing street direction"),
-            (f"{num} {street} St., {city}, {normalized_country}", "Abbreviated with period"),
-            (f"{num}{street[:10]} Street, {city}, {normalized_country}", "Missing space after number"),
-        ]
-        uav_address, label = random.choice(uav_options)
+        template, label = random.choice(_GENERIC_UAV_TEMPLATES)
+        uav_address = template.format(num=num, street=street, city=city, country=normalized_country)
         
         # Ensure address is at least 30 characters (validator requirement)
-        addr_len = len(''.join(c for c in uav_address if c.isalnum()))
+        addr_len = _alnum_len(uav_address)
         if addr_len < 30:
             # Fallback to longest generic street name
-            longest_street = max(generic_street_options, key=len)
+            longest_street = max(_GENERIC_UAV_STREETS, key=len)
             uav_address = f"{num} {longest_street} Str, {city}, {normalized_country}"
             label = "Common typo (Str vs St)"
             
             # Final check - if still too short, add more details
-            addr_len = len(''.join(c for c in uav_address if c.isalnum()))
+            addr_len = _alnum_len(uav_address)
             if addr_len < 30:
                 uav_address = f"{num} {longest_street} Street Str, {city}, {normalized_country}"
                 label = "Common typo (Str vs St)"
     
-    # Generate realistic coordinates based on country (approximate)
-    # Comprehensive country database with geographic centers
-    # These are rough approximations - in production, use geocoding API
-    country_coords = {
-        # North America
-        "USA": (39.8283, -98.5795), "United States": (39.8283, -98.5795),
-        "US": (39.8283, -98.5795), "United States of America": (39.8283, -98.5795),
-        "Canada": (56.1304, -106.3468), "Mexico": (23.6345, -102.5528),
-        # Central America & Caribbean
-        "Haiti": (18.9712, -72.2852), "Honduras": (15.2000, -86.2419),
-        "Cuba": (21.5218, -77.7812), "Jamaica": (18.1096, -77.2975),
-        "Guatemala": (15.7835, -90.2308), "Belize": (17.1899, -88.4976),
-        "El Salvador": (13.7942, -88.8965), "Nicaragua": (12.2650, -85.2072),
-        "Costa Rica": (9.7489, -83.7534), "Panama": (8.5380, -80.7821),
-        "Dominican Republic": (18.7357, -70.1627), "Puerto Rico": (18.2208, -66.5901),
-        # South America
-        "Brazil": (-14.2350, -51.9253), "Argentina": (-38.4161, -63.6167),
-        "Colombia": (4.5709, -74.2973), "Peru": (-9.1900, -75.0152),
-        "Venezuela": (6.4238, -66.5897), "Chile": (-35.6751, -71.5430),
-        "Ecuador": (-1.8312, -78.1834), "Bolivia": (-16.2902, -63.5887),
-        "Paraguay": (-23.4425, -58.4438), "Uruguay": (-32.5228, -55.7658),
-        # Europe
-        "UK": (54.7024, -3.2766), "United Kingdom": (54.7024, -3.2766),
-        "Britain": (54.7024, -3.2766), "Great Britain": (54.7024, -3.2766),
-        "Germany": (51.1657, 10.4515), "France": (46.2276, 2.2137),
-        "Spain": (40.4637, -3.7492), "Italy": (41.8719, 12.5674),
-        "Russia": (61.5240, 105.3188), "Poland": (51.9194, 19.1451),
-        "Netherlands": (52.1326, 5.2913), "Belgium": (50.5039, 4.4699),
-        "Greece": (39.0742, 21.8243), "Portugal": (39.3999, -8.2245),
-        "Sweden": (60.1282, 18.6435), "Norway": (60.4720, 8.4689),
-        "Denmark": (56.2639, 9.5018), "Finland": (61.9241, 25.7482),
-        "Switzerland": (46.8182, 8.2275), "Austria": (47.5162, 14.5501),
-        "Czech Republic": (49.8175, 15.4730), "Romania": (45.9432, 24.9668),
-        "Hungary": (47.1625, 19.5033), "Ukraine": (48.3794, 31.1656),
-        "Turkey": (38.9637, 35.2433), "Ireland": (53.4129, -8.2439),
-        # Asia
-        "China": (35.8617, 104.1954), "India": (20.5937, 78.9629),
-        "Japan": (36.2048, 138.2529), "South Korea": (35.9078, 127.7669),
-        "North Korea": (40.3399, 127.5101), "Thailand": (15.8700, 100.9925),
-        "Vietnam": (14.0583, 108.2772), "Philippines": (12.8797, 121.7740),
-        "Indonesia": (-0.7893, 113.9213), "Malaysia": (4.2105, 101.9758),
-        "Singapore": (1.3521, 103.8198), "Bangladesh": (23.6850, 90.3563),
-        "Pakistan": (30.3753, 69.3451), "Afghanistan": (33.9391, 67.7100),
-        "Iran": (32.4279, 53.6880), "Iraq": (33.2232, 43.6793),
-        "Saudi Arabia": (23.8859, 45.0792), "UAE": (23.4241, 53.8478),
-        "United Arab Emirates": (23.4241, 53.8478), "Israel": (31.0461, 34.8516),
-        "Lebanon": (33.8547, 35.8623), "Jordan": (30.5852, 36.2384),
-        "Syria": (34.8021, 38.9968), "Yemen": (15.5527, 48.5164),
-        # Africa
-        "Egypt": (26.8206, 30.8025), "Libya": (26.3351, 17.2283),
-        "Sudan": (12.8628, 30.2176), "Ethiopia": (9.1450, 38.7667),
-        "Kenya": (-0.0236, 37.9062), "Nigeria": (9.0820, 8.6753),
-        "South Africa": (-30.5595, 22.9375), "Ghana": (7.9465, -1.0232),
-        "Morocco": (31.7917, -7.0926), "Algeria": (28.0339, 1.6596),
-        "Tunisia": (33.8869, 9.5375), "Mauritius": (-20.3484, 57.5522),
-        "Gabon": (-0.8037, 11.6094), "Benin": (9.3077, 2.3158),
-        "Namibia": (-22.9576, 18.4904), "Papua New Guinea": (-6.3150, 143.9555),
-        # Additional sanctioned countries
-        "South Sudan": (6.8770, 31.3070), "Central African Republic": (6.6111, 20.9394),
-        "Democratic Republic of the Congo": (-4.0383, 21.7587), "DRC": (-4.0383, 21.7587),
-        "Congo, Democratic Republic of the": (-4.0383, 21.7587), "Mali": (17.5707, -3.9962),
-        "Angola": (-11.2027, 17.8739), "Burkina Faso": (12.2383, -1.5616),
-        "Cameroon": (7.3697, 12.3547), "Ivory Coast": (7.5400, -5.5471),
-        "Cote d'Ivoire": (7.5400, -5.5471), "British Virgin Islands": (18.4207, -64.6399),
-        "Monaco": (43.7384, 7.4246), "Mozambique": (-18.6657, 35.5296),
-        "Myanmar": (21.9162, 95.9560), "Laos": (19.8563, 102.4955),
-        "Nepal": (28.3949, 84.1240), "Somalia": (5.1521, 46.1996),
-        # Additional Cyrillic sanctioned regions
-        "Belarus": (53.7098, 27.9534), "Bulgaria": (42.7339, 25.4858),
-        "Crimea": (45.3388, 33.5000), "Donetsk": (48.0159, 37.8029),
-        "Luhansk": (48.5740, 39.3078),
-        # Oceania
-        "Australia": (-25.2744, 133.7751), "New Zealand": (-40.9006, 174.8860),
-        # Middle East (already listed above, keeping for organization)
-        "Kuwait": (29.3117, 47.4818), "Qatar": (25.3548, 51.1839),
-        "Bahrain": (25.9304, 50.6378), "Oman": (21.4735, 55.9754),
-    }
     
     # Normalize country name for matching (lowercase, handle common variations)
     # Use normalized_country for coordinate lookup
@@ -883,17 +1137,12 @@ def generate_uav_address(address: str) -> Dict:
     
     # Try to find country in our map (case-insensitive, partial matching)
     lat, lon = None, None
-    for country_key, coords in country_coords.items():
-        country_key_lower = country_key.lower()
-        # Exact match or substring match (either direction)
-        if (country_key_lower == country_for_coords or
-            country_key_lower in country_for_coords or
-            country_for_coords in country_key_lower):
-            lat, lon = coords
-            # Add small random offset to make it unique (within ~50km)
-            lat += random.uniform(-0.5, 0.5)
-            lon += random.uniform(-0.5, 0.5)
-            break
+    coords = _resolve_coords(country_for_coords)
+    if coords is not None:
+        lat, lon = coords
+        # Add small random offset to make it unique (within ~50km)
+        lat += random.uniform(-0.5, 0.5)
+        lon += random.uniform(-0.5, 0.5)
     
     # Fallback: Try to get approximate coordinates for unrecognized countries
     # Use a basic heuristic based on country name patterns
@@ -904,7 +1153,8 @@ def generate_uav_address(address: str) -> Dict:
         lon = random.uniform(-180, 180)
         # Log for debugging (use original_country for display)
         if original_country:
-            print(f"   ⚠️  Country '{original_country}' not found in database, using approximate coordinates")
+            _warn_once(f"coords:{original_country}",
+                       "Country '%s' not found in database, using approximate coordinates", original_country)
     
     return {
         'address': uav_address,
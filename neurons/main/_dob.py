@@ -1,45 +1,137 @@
 import random
 
-from datetime import datetime, timedelta
+from datetime import date, datetime
+from typing import List
+
+# Use NumPy to generate DOB variations for many identities at once when available
+try:
+    import numpy as np
+    NUMPY_AVAILABLE = True
+except ImportError:
+    NUMPY_AVAILABLE = False
+
+# Compile the ordinal -> (year, month, day) kernel with Numba when available
+try:
+    from numba import njit
+    NUMBA_AVAILABLE = NUMPY_AVAILABLE
+except ImportError:
+    NUMBA_AVAILABLE = False
+
+# Fixed day offsets, in output order: ±1, ±3, ±30, ±90, ±365 days
+_LEADING_OFFSETS = (1, -3, 30, 90, -365)
+_TRAILING_OFFSETS = (-1, 3, -30, -90, 365)
+# Random fill offsets (±1 year)
+_RANDOM_OFFSETS = range(-365, 366)
+
+
+def _parse_dob(dob: str) -> date:
+    """Parse a YYYY-MM-DD DOB, falling back to 1990-01-01."""
+    try:
+        return datetime.strptime(dob, "%Y-%m-%d").date()
+    except (ValueError, TypeError):
+        return date(1990, 1, 1)
+
+
+def _ordinals_to_iso(base_ord, offsets):
+    """Write base_ord + offsets (ordinals as date.toordinal) as packed ASCII YYYY-MM-DD, 10 bytes each"""
+    n = offsets.shape[0]
+    out = np.empty(n * 10, dtype=np.uint8)
+    for i in range(n):
+        # Days since 0000-03-01, split into 400-year eras (civil_from_days)
+        z = base_ord + offsets[i] + 305
+        era = z // 146097
+        doe = z - era * 146097
+        yoe = (doe - doe // 1460 + doe // 36524 - doe // 146096) // 365
+        doy = doe - (365 * yoe + yoe // 4 - yoe // 100)
+        mp = (5 * doy + 2) // 153
+        day = doy - (153 * mp + 2) // 5 + 1
+        month = mp + 3 if mp < 10 else mp - 9
+        year = yoe + era * 400 + (1 if month <= 2 else 0)
+
+        j = i * 10
+        out[j] = 48 + year // 1000 % 10
+        out[j + 1] = 48 + year // 100 % 10
+        out[j + 2] = 48 + year // 10 % 10
+        out[j + 3] = 48 + year % 10
+        out[j + 4] = 45  # '-'
+        out[j + 5] = 48 + month // 10
+        out[j + 6] = 48 + month % 10
+        out[j + 7] = 45
+        out[j + 8] = 48 + day // 10
+        out[j + 9] = 48 + day % 10
+    return out
+
+
+if NUMBA_AVAILABLE:
+    _dob_offsets_to_iso = njit(cache=True)(_ordinals_to_iso)
+    _FIXED_OFFSETS = np.array(_LEADING_OFFSETS + _TRAILING_OFFSETS, dtype=np.int64)
+    # Compile at import so the first request does not pay the JIT cost
+    _dob_offsets_to_iso(date(1990, 1, 1).toordinal(), _FIXED_OFFSETS)
 
 
 def generate_dob_variations(dob: str, count: int = 15):
     """Generate DOB variations"""
-    try:
-        base_date = datetime.strptime(dob, "%Y-%m-%d")
-    except:
-        base_date = datetime(1990, 1, 1)
-    
-    variations = []
-    
-    # ±1 day
-    variations.append((base_date + timedelta(days=1)).strftime("%Y-%m-%d"))
-    
-    # ±3 days
-    variations.append((base_date - timedelta(days=3)).strftime("%Y-%m-%d"))
-    
-    # ±30 days
-    variations.append((base_date + timedelta(days=30)).strftime("%Y-%m-%d"))
-    
-    # ±90 days
-    variations.append((base_date + timedelta(days=90)).strftime("%Y-%m-%d"))
-    
-    # ±365 days
-    variations.append((base_date - timedelta(days=365)).strftime("%Y-%m-%d"))
-    
+    base_date = _parse_dob(dob)
+
+    # Work on day ordinals: one int add and isoformat() per variation
+    base_ordinal = base_date.toordinal()
+
+    variations = [date.fromordinal(base_ordinal + offset).isoformat() for offset in _LEADING_OFFSETS]
+
     # Year+month only
-    variations.append(base_date.strftime("%Y-%m"))
-    
-    variations.append((base_date - timedelta(days=1)).strftime("%Y-%m-%d"))
-    variations.append((base_date + timedelta(days=3)).strftime("%Y-%m-%d"))
-    variations.append((base_date - timedelta(days=30)).strftime("%Y-%m-%d"))
-    variations.append((base_date - timedelta(days=90)).strftime("%Y-%m-%d"))
-    variations.append((base_date + timedelta(days=365)).strftime("%Y-%m-%d"))
+    variations.append(f"{base_date.year:04d}-{base_date.month:02d}")
+
+    variations.extend(date.fromordinal(base_ordinal + offset).isoformat() for offset in _TRAILING_OFFSETS)
+
+    # Fill remaining with random variations (offsets drawn in one call)
+    remaining = count - len(variations)
+    if remaining > 0:
+        offsets = random.choices(_RANDOM_OFFSETS, k=remaining)
+        variations.extend(date.fromordinal(base_ordinal + offset).isoformat() for offset in offsets)
+
+    return variations[:count]
+
+
+def generate_dob_variations_batch(dobs: List[str], count: int = 15) -> List[List[str]]:
+    """Generate DOB variations for several DOBs at once (one row per DOB, same layout as generate_dob_variations)"""
+    if not NUMPY_AVAILABLE or not dobs:
+        return [generate_dob_variations(dob, count) for dob in dobs]
+
+    base_dates = [_parse_dob(dob) for dob in dobs]
+    random_count = max(count - len(_LEADING_OFFSETS) - len(_TRAILING_OFFSETS) - 1, 0)
+    # Drawn from random (not np.random) so random.seed reproduces the same rows
+    # as calling generate_dob_variations once per DOB
+    random_offsets = np.array(
+        random.choices(_RANDOM_OFFSETS, k=len(dobs) * random_count), dtype=np.int64
+    ).reshape(len(dobs), random_count)
     
-    # Fill remaining with random variations
-    while len(variations) < count:
-        days_offset = random.randint(-365, 365)
-        new_date = base_date + timedelta(days=days_offset)
-        variations.append(new_date.strftime("%Y-%m-%d"))
+    if NUMBA_AVAILABLE:
+        # Fixed offsets for every row, then the random fill, as absolute ordinals for the kernel
+        offsets = np.concatenate(
+            [np.broadcast_to(_FIXED_OFFSETS, (len(dobs), len(_FIXED_OFFSETS))), random_offsets],
+            axis=1
+        )
+        base_ords = np.array([base_date.toordinal() for base_date in base_dates], dtype=np.int64)
+        packed = _dob_offsets_to_iso(0, (base_ords[:, None] + offsets).ravel()).tobytes().decode('ascii')
+        row_chars = offsets.shape[1] * 10
+        rows = [
+            [packed[j:j + 10] for j in range(i, i + row_chars, 10)]
+            for i in range(0, len(packed), row_chars)
+        ]
+    else:
+        base = np.array([base_date.isoformat() for base_date in base_dates], dtype='datetime64[D]')
+        
+        # Fixed offsets for every row, then the random fill (drawn in one call)
+        fixed = np.array(_LEADING_OFFSETS + _TRAILING_OFFSETS, dtype='timedelta64[D]')
+        offsets = np.concatenate(
+            [np.broadcast_to(fixed, (len(dobs), len(fixed))), random_offsets.astype('timedelta64[D]')],
+            axis=1
+        )
+        rows = np.datetime_as_string(base[:, None] + offsets, unit='D').tolist()
     
-    return variations[:count]
\ No newline at end of file
+    # Insert the year+month entry after the leading offsets
+    split = len(_LEADING_OFFSETS)
+    return [
+        (row[:split] + [f"{base_date.year:04d}-{base_date.month:02d}"] + row[split:])[:count]
+        for row, base_date in zip(rows, base_dates)
+    ]
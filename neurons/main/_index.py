@@ -14,6 +14,8 @@ import json
 import os
 import sys
 import time
+from concurrent.futures import Future, ThreadPoolExecutor
+from threading import Lock
 from datetime import datetime, timedelta
 from typing import List, Dict, Optional
 
@@ -28,6 +30,11 @@ except ImportError:
 # Import name_variations.py directly
 sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
 from _name_variations import generate_name_variations
+from _parse_query import parse_query_template
+from _name import generate_name_variations_batch
+from _dob import generate_dob_variations_batch
+from _address import generate_address_variations
+from _address1 import generate_uav_address
 
 # Import jellyfish for tiered similarity generation
 try:
@@ -39,6 +46,11 @@ except ImportError:
 
 # Import geonamescache for getting real city names
 
+# Defaults for missing identity fields: name, dob, address
+_IDENTITY_DEFAULTS = ("Unknown", "1990-01-01", "Unknown")
+# Identities generated concurrently by generate_variations
+_MAX_IDENTITY_WORKERS = 8
+
 # Minimal IdentitySynapse class
 class IdentitySynapse:
     def __init__(self, identity, query_template, timeout=120.0):
@@ -46,233 +58,290 @@ class IdentitySynapse:
         self.query_template = query_template
         self.timeout = timeout
 
-def generate_variations(synapse: IdentitySynapse) :
+class _SharedCalls:
     """
-    Generate variations for all identities.
-    Returns different structure for UAV seed vs normal seeds.
+    Run fn once per distinct argument; repeated (or concurrent) calls with the
+    same argument wait for that result and get their own copy of the list.
+    """
+    def __init__(self, fn):
+        self._fn = fn
+        self._lock = Lock()
+        self._results = {}
+
+    def __call__(self, arg):
+        with self._lock:
+            future = self._results.get(arg)
+            owner = future is None
+            if owner:
+                future = self._results[arg] = Future()
+        if owner:
+            try:
+                future.set_result(tuple(self._fn(arg)))
+            except Exception as e:
+                future.set_exception(e)
+        return list(future.result())
+
+def _process_identity(identity, dob_vars, requirements, uav_seed_name_lc,
+                      generate_names, generate_addresses, verbose=False):
+    """
+    Generate the rows for one (name, dob, address) identity.
+    generate_names / generate_addresses take the seed name / address.
+    Returns (name, (variations, uav or None)).
+    """
+    name, dob, address = identity
+    variation_count = requirements['variation_count']
+    
+    if verbose:
+        print(f"    Processing: {name} | {dob} | {address}")
+    is_uav_seed = uav_seed_name_lc is not None and name.lower() == uav_seed_name_lc
+    
+    if verbose and is_uav_seed:
+        print(f"        This is the UAV seed - will include UAV data")
+    
+    # Degenerate request: skip the generators entirely
+    if variation_count <= 0:
+        return name, ([], generate_uav_address(address) if is_uav_seed else None)
+    
+    # Generate variations with tiered similarity targeting
+    name_vars = generate_names(name)
+    address_vars = generate_addresses(address)
+    
+    # CRITICAL: Ensure we have EXACTLY the requested count
+    # Validator requires exact count match for completeness multiplier
+    # Ensure all arrays have at least the required count
+    while len(name_vars) < variation_count:
+        # Add more variations if needed
+        name_vars.append(name)
+    while len(dob_vars) < variation_count:
+        dob_vars.append(dob)
+    while len(address_vars) < variation_count:
+        address_vars.append(address)
+    
+    # Trim to exact count; empty entries fall back to the seed value
+    name_vars = [name_var or name for name_var in name_vars[:variation_count]]
+    dob_vars = [dob_var or dob for dob_var in dob_vars[:variation_count]]
+    address_vars = [addr_var or address for addr_var in address_vars[:variation_count]]
+    
+    # Combine into [name, dob, address] format
+    # CRITICAL: Ensure no duplicates - validator penalizes duplicates
+    combined = [None] * variation_count
+    seen_combinations = set()
+    if verbose:
+        print(f"        Generated, name: {len(name_vars)} | dob: {len(dob_vars)} | address {len(address_vars)}\n")
+    # Normalize once for duplicate detection (same as validator)
+    # str.lower() already takes an ASCII fast path; an encode/translate/decode round trip is ~3x slower
+    name_keys = [name_var.lower().strip() for name_var in name_vars]
+    dob_keys = [dob_var.strip() for dob_var in dob_vars]
+    addr_keys = [addr_var.lower().strip() for addr_var in address_vars]
+    for i in range(variation_count):
+        name_var = name_vars[i]
+        dob_var = dob_vars[i]
+        addr_var = address_vars[i]
+        combo_key = (name_keys[i], dob_keys[i], addr_keys[i])
+        
+        # If duplicate, add a unique suffix to address to make it unique
+        if combo_key in seen_combinations:
+            addr_var = f"{addr_var} #UNQ{i}"
+            combo_key = (name_keys[i], dob_keys[i], addr_var.lower().strip())
+        
+        seen_combinations.add(combo_key)
+        combined[i] = [name_var, dob_var, addr_var]
+    
+    # Phase 3: Return different structure for UAV seed
+    if is_uav_seed:
+        # Generate UAV address
+        uav_data = generate_uav_address(address)
+        if verbose:
+            print(f"   🎯 Generated UAV: {uav_data['address']} ({uav_data['label']})")
+            print(f"      Coordinates: ({uav_data['latitude']}, {uav_data['longitude']})")
+    else:
+        uav_data = None
+    
+    # Kept as (variations, uav or None) until the output is shaped at return
+    return name, (combined, uav_data)
+
+def _fit_variation_count(name, var_list, expected_count, name_to_identity):
+    """Pad or trim one identity's rows to exactly expected_count"""
+    actual_count = len(var_list)
+    if actual_count == expected_count:
+        return var_list
+    
+    print(f"X  WARNING: {name}: {actual_count} variations (expected {expected_count})")
+    deficit = expected_count - actual_count
+    if deficit <= 0:
+        # Trim to exact count
+        return var_list[:expected_count]
+    
+    # Pad with copies of the last variation or default (rows are handed to callers, so no aliasing)
+    if var_list:
+        var_list.extend([list(var_list[-1]) for _ in range(deficit)])
+        return var_list
+    
+    # No variations - add default
+    default_identity = name_to_identity.get(name)
+    if default_identity:
+        default_var = [
+            default_identity[0] if len(default_identity) > 0 else name,
+            default_identity[1] if len(default_identity) > 1 else "1990-01-01",
+            default_identity[2] if len(default_identity) > 2 else "Unknown"
+        ]
+        return [default_var.copy() for _ in range(expected_count)]
+    return [[name, "1990-01-01", "Unknown"] for _ in range(expected_count)]
+
+def iter_variations(synapse: IdentitySynapse, verbose: bool = False):
     """
-    print("=" * 80)
-    print("SYNAPSE LOADED SUCCESSFULLY")
-    print("=" * 80)
-    print(f"📊 Identities: {len(synapse.identity)}")
-    print(f"⏱️  Timeout: {synapse.timeout}s")
-    print(f"\n📋 Query Template:")
-    print(synapse.query_template)
-    print(f"\n👥 Identities:")
-    for i, identity in enumerate(synapse.identity, 1):
-        name = identity[0] if len(identity) > 0 else "Unknown"
-        dob = identity[1] if len(identity) > 1 else "Unknown"
-        address = identity[2] if len(identity) > 2 else "Unknown"
-        print(f"   {i:2d}. {name} | {dob} | {address}")
-    print("=" * 80)
-    
-    from _parse_query import parse_query_template
+    Yield (name, variations) once per seed name in output order, one at a time.
+    Entries have the same shape as in generate_variations; for a repeated name
+    the last identity's entry is kept, at the position of the first (as a dict would).
+    Progress and results are printed only when verbose is set.
+    """
+    if verbose:
+        print("=" * 80)
+        print("SYNAPSE LOADED SUCCESSFULLY")
+        print("=" * 80)
+        print(f"📊 Identities: {len(synapse.identity)}")
+        print(f"⏱️  Timeout: {synapse.timeout}s")
+        print(f"\n📋 Query Template:")
+        print(synapse.query_template)
+        print(f"\n👥 Identities:")
+        for i, identity in enumerate(synapse.identity, 1):
+            name = identity[0] if len(identity) > 0 else "Unknown"
+            dob = identity[1] if len(identity) > 1 else "Unknown"
+            address = identity[2] if len(identity) > 2 else "Unknown"
+            print(f"   {i:2d}. {name} | {dob} | {address}")
+        print("=" * 80)
+    
+    # Nothing to generate
+    if not synapse.identity:
+        return
+    
     requirements = parse_query_template(synapse.query_template)
     
-    print("=" * 80)
-    print("CLEAN VARIATION GENERATOR - NO VALIDATION, NO SCORING")
-    print("=" * 80)
-    print(f"\nRequirements:")
-    print(f"   Variation count: {requirements['variation_count']}")
-    print(f"   Rule percentage: {requirements['rule_percentage']*100:.0f}%")
-    print(f"   Rules: {requirements['rules']}")
-    if requirements.get('phonetic_similarity'):
-        print(f"   🎵 Phonetic Similarity: {requirements['phonetic_similarity']}")
-    if requirements.get('orthographic_similarity'):
-        print(f"   📝 Orthographic Similarity: {requirements['orthographic_similarity']}")
-    if requirements['uav_seed_name']:
-        print(f"   🎯 UAV Seed: {requirements['uav_seed_name']}")
-    print()
-    
-    all_variations = {}
+    if verbose:
+        print("=" * 80)
+        print("CLEAN VARIATION GENERATOR - NO VALIDATION, NO SCORING")
+        print("=" * 80)
+        print(f"\nRequirements:")
+        print(f"   Variation count: {requirements['variation_count']}")
+        print(f"   Rule percentage: {requirements['rule_percentage']*100:.0f}%")
+        print(f"   Rules: {requirements['rules']}")
+        if requirements.get('phonetic_similarity'):
+            print(f"   🎵 Phonetic Similarity: {requirements['phonetic_similarity']}")
+        if requirements.get('orthographic_similarity'):
+            print(f"   📝 Orthographic Similarity: {requirements['orthographic_similarity']}")
+        if requirements['uav_seed_name']:
+            print(f"   🎯 UAV Seed: {requirements['uav_seed_name']}")
+        print()
+    
     uav_seed_name = requirements['uav_seed_name']
+    variation_count = requirements['variation_count']
     
     # CRITICAL: Ensure we process ALL identities from seed (no missing names)
     # Validator checks: missing_names = set(seed_names) - set(variations.keys())
-    seed_names = [identity[0] for identity in synapse.identity if len(identity) > 0]
+    seed_names_set = {identity[0] for identity in synapse.identity if identity}
+    # First identity wins for repeated names (matches the old linear search)
+    name_to_identity = {identity[0]: identity for identity in reversed(synapse.identity) if identity}
     
-    for identity in synapse.identity:
-        name = identity[0] if len(identity) > 0 else "Unknown"
-        dob = identity[1] if len(identity) > 1 else "1990-01-01"
-        address = identity[2] if len(identity) > 2 else "Unknown"
-        
-        print(f"    Processing: {name} | {dob} | {address}")
-        is_uav_seed = (uav_seed_name and name.lower() == uav_seed_name.lower())
-        
-        if is_uav_seed:
-            print(f"        This is the UAV seed - will include UAV data")
-        
-        # Generate variations with tiered similarity targeting
-        from _name import generate_name_variations_clean
-        name_vars = generate_name_variations_clean(
-            original_name=name,
-            variation_count=requirements['variation_count'],
-            rule_percentage=requirements['rule_percentage'],
-            rules=requirements['rules'],
-            phonetic_similarity=requirements.get('phonetic_similarity'),
-            orthographic_similarity=requirements.get('orthographic_similarity')
+    # (name, dob, address) per identity, missing fields filled from the defaults
+    identities = [(*identity[:3], *_IDENTITY_DEFAULTS[len(identity):]) for identity in synapse.identity]
+    
+    # DOB variations for every identity in one batch
+    dob_rows = generate_dob_variations_batch([dob for _, dob, _ in identities], variation_count)
+    
+    uav_seed_name_lc = uav_seed_name.lower() if uav_seed_name else None
+    
+    # Name variations for every distinct name up front (CPU-bound; large batches
+    # go to a process pool), repeated names/addresses in one request are generated once
+    unique_names = list(dict.fromkeys(name for name, _, _ in identities)) if variation_count > 0 else []
+    name_rows = dict(zip(unique_names, generate_name_variations_batch([
+        (
+            name,
+            variation_count,
+            requirements['rule_percentage'],
+            list(requirements['rules']),
+            requirements.get('phonetic_similarity'),
+            requirements.get('orthographic_similarity')
         )
-        from _dob import generate_dob_variations
-        dob_vars = generate_dob_variations(dob, requirements['variation_count'])
-        
-        from _address import generate_address_variations
-        address_vars = generate_address_variations(address, requirements['variation_count'])
-        
-        # CRITICAL: Ensure we have EXACTLY the requested count
-        # Validator requires exact count match for completeness multiplier
-        variation_count = requirements['variation_count']
-        
-        # Ensure all arrays have at least the required count
-        while len(name_vars) < variation_count:
-            # Add more variations if needed
-            name_vars.append(name)
-        while len(dob_vars) < variation_count:
-            dob_vars.append(dob)
-        while len(address_vars) < variation_count:
-            address_vars.append(address)
-        
-        # Trim to exact count
-        name_vars = name_vars[:variation_count]
-        dob_vars = dob_vars[:variation_count]
-        address_vars = address_vars[:variation_count]
-        
-        # Combine into [name, dob, address] format
-        # CRITICAL: Ensure no duplicates - validator penalizes duplicates
-        combined = []
-        seen_combinations = set()
-        print(f"        Generated, name: {len(name_vars)} | dob: {len(dob_vars)} | address {len(address_vars)}\n")
-        for i in range(variation_count):
-            # Create unique combination by checking for duplicates
-            name_var = name_vars[i]
-            dob_var = dob_vars[i]
-            addr_var = address_vars[i]
-            
-            # Normalize for duplicate detection (same as validator)
-            combo_key = (
-                name_var.lower().strip() if name_var else "",
-                dob_var.strip() if dob_var else "",
-                addr_var.lower().strip() if addr_var else ""
-            )
-            
-            # If duplicate, modify slightly to make unique
-            attempt = 0
-            while combo_key in seen_combinations and attempt < 100:
-                # Try next variation in arrays
-                idx = (i + attempt) % variation_count
-                name_var = name_vars[idx] if idx < len(name_vars) else name
-                dob_var = dob_vars[idx] if idx < len(dob_vars) else dob
-                addr_var = address_vars[idx] if idx < len(address_vars) else address
-                combo_key = (
-                    name_var.lower().strip() if name_var else "",
-                    dob_var.strip() if dob_var else "",
-                    addr_var.lower().strip() if addr_var else ""
-                )
-                attempt += 1
-            
-            # If still duplicate, create a unique one by modifying address slightly
-            if combo_key in seen_combinations:
-                # Add a unique suffix to address to make it unique
-                addr_var = f"{addr_var} #UNQ{i}"
-                combo_key = (
-                    name_var.lower().strip() if name_var else "",
-                    dob_var.strip() if dob_var else "",
-                    addr_var.lower().strip() if addr_var else ""
-                )
-            
-            seen_combinations.add(combo_key)
-            combined.append([name_var, dob_var, addr_var])
+        for name in unique_names
+    ])))
+    
+    def generate_names(name):
+        return list(name_rows[name])
+    
+    generate_addresses = _SharedCalls(lambda address: generate_address_variations(address, variation_count))
+    
+    def process(args):
+        return _process_identity(*args, requirements, uav_seed_name_lc,
+                                 generate_names, generate_addresses, verbose)
+    
+    # Identities are independent (address lookups are mostly network I/O), so run
+    # them on a thread pool; verbose runs stay sequential to keep the output readable
+    workers = 1 if verbose else min(_MAX_IDENTITY_WORKERS, len(identities))
+    if workers > 1:
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            results = list(executor.map(process, zip(identities, dob_rows)))
+    else:
+        results = list(map(process, zip(identities, dob_rows)))
+    
+    if verbose:
+        print("\n" + "=" * 80)
+        print("RESULTS")
+        print("=" * 80)
+    
+    # One entry per name: the last identity wins, in first-seen order
+    results = dict(results)
+    
+    # CRITICAL: Validate completeness while emitting
+    output_names = set()
+    extra = set()
+    for name, (var_list, uav_data) in results.items():
+        # Extra names (not in seed) would be penalized - drop them
+        if name not in seed_names_set:
+            extra.add(name)
+            continue
+        output_names.add(name)
         
-        # CRITICAL: Ensure exact count (validator checks this strictly)
-        combined = combined[:variation_count]
+        # Exact variation count (validator checks this strictly)
+        var_list = _fit_variation_count(name, var_list, variation_count, name_to_identity)
         
-        # Phase 3: Return different structure for UAV seed
-        if is_uav_seed:
-            # Generate UAV address
-            from _address1 import generate_uav_address
-            uav_data = generate_uav_address(address)
-            print(f"   🎯 Generated UAV: {uav_data['address']} ({uav_data['label']})")
-            print(f"      Coordinates: ({uav_data['latitude']}, {uav_data['longitude']})")
-            
-            # UAV seed structure: {name: {variations: [...], uav: {...}}}
-            all_variations[name] = {
-                'variations': combined,
-                'uav': uav_data
-            }
-        else:
-            # Normal structure: {name: [[name, dob, addr], ...]}
-            all_variations[name] = combined
+        if verbose:
+            print(f"\n📝 Variations for: {name}")
+            for i, var in enumerate(var_list, 1):
+                print(f"   {i}. {var[0]} | {var[1]} | {var[2]}")
         
+        # UAV seed structure: {name: {variations: [...], uav: {...}}}
+        # Normal structure: {name: [[name, dob, addr], ...]}
+        yield name, var_list if uav_data is None else {'variations': var_list, 'uav': uav_data}
     
-    # CRITICAL: Validate completeness before returning
-    # 1. Check for missing names
-    output_names = set(all_variations.keys())
-    missing = set(seed_names) - output_names
+    if extra:
+        print(f"X  WARNING: Extra names in output (will be penalized): {extra}")
+    
+    # Missing names get default rows (shouldn't happen, but safety check)
+    missing = seed_names_set - output_names
     if missing:
         print(f"X  WARNING: Missing names in output: {missing}")
-        # Add missing names with empty variations (shouldn't happen, but safety check)
         for missing_name in missing:
-            all_variations[missing_name] = []
-    
-    # 2. Check for extra names (names not in seed)
-    extra = output_names - set(seed_names)
-    if extra:
-        print(f"X  WARNING: Extra names in output (will be penalized): {extra}")
-        # Remove extra names to avoid penalty
-        for extra_name in list(extra):
-            del all_variations[extra_name]
-    
-    # 3. Validate variation counts
-    for name, variations in all_variations.items():
-        if isinstance(variations, dict):
-            # UAV structure
-            var_list = variations.get('variations', [])
-        else:
-            var_list = variations
-        
-        expected_count = requirements['variation_count']
-        actual_count = len(var_list)
-        if actual_count != expected_count:
-            print(f"X  WARNING: {name}: {actual_count} variations (expected {expected_count})")
-            # Ensure exact count
-            if actual_count < expected_count:
-                # Pad with last variation or default
-                if var_list:
-                    last_var = var_list[-1]
-                    while len(var_list) < expected_count:
-                        var_list.append(last_var.copy() if isinstance(last_var, list) else last_var)
-                else:
-                    # No variations - add default
-                    default_identity = next((id for id in synapse.identity if id[0] == name), None)
-                    if default_identity:
-                        default_var = [
-                            default_identity[0] if len(default_identity) > 0 else name,
-                            default_identity[1] if len(default_identity) > 1 else "1990-01-01",
-                            default_identity[2] if len(default_identity) > 2 else "Unknown"
-                        ]
-                        var_list = [default_var.copy() for _ in range(expected_count)]
-                    else:
-                        var_list = [[name, "1990-01-01", "Unknown"] for _ in range(expected_count)]
-            else:
-                # Trim to exact count
-                var_list = var_list[:expected_count]
-            
-            # Update the variations
-            if isinstance(variations, dict):
-                variations['variations'] = var_list
-                all_variations[name] = variations
-            else:
-                all_variations[name] = var_list
-    
-    print("\n" + "=" * 80)
-    print("RESULTS")
-    print("=" * 80)
-    
-    for original_name, var_list in all_variations.items():
-        print(f"\n📝 Variations for: {original_name}")
-        for i, var in enumerate(var_list, 1):
-            print(f"   {i}. {var[0]} | {var[1]} | {var[2]}")
-    
-    return all_variations
+            yield missing_name, _fit_variation_count(missing_name, [], variation_count, name_to_identity)
+
+def generate_variations(synapse: IdentitySynapse, verbose: bool = False) :
+    """
+    Generate variations for all identities.
+    Returns different structure for UAV seed vs normal seeds.
+    Progress and results are printed only when verbose is set.
+    """
+    return dict(iter_variations(synapse, verbose))
+
+def write_variations_json(items, f):
+    """Write (name, variations) pairs to f as one JSON object, an entry at a time"""
+    f.write("{")
+    separator = "\n  "
+    for name, entry in items:
+        f.write(separator)
+        f.write(json.dumps(name, ensure_ascii=False))
+        f.write(": ")
+        f.write(json.dumps(entry, ensure_ascii=False))
+        separator = ",\n  "
+    f.write("\n}\n")
 
 # ============================================================================
 # Entry Point
@@ -298,7 +367,13 @@ def main():
         timeout=data.get('timeout', 120.0)
     )
     
-    variations = generate_variations(synapse)
+    if output_file:
+        # Stream entries to the file as they are produced (miner response format)
+        with open(output_file, 'w', encoding='utf-8') as f:
+            write_variations_json(iter_variations(synapse, verbose=True), f)
+        print(f"\n💾 Saved to: {output_file}")
+    else:
+        generate_variations(synapse, verbose=True)
     
     # Print results
     # print("\n" + "=" * 80)
@@ -1,5 +1,8 @@
 import random
 import re
+from bisect import bisect_right
+from functools import lru_cache
+from itertools import zip_longest
 from typing import List, Dict, Optional
 
 
@@ -10,6 +13,15 @@ try:
 except ImportError:
     JELLYFISH_AVAILABLE = False
 
+# Import rapidfuzz + NumPy for the vectorized uniqueness filter
+try:
+    import numpy as np
+    from rapidfuzz import process as rf_process
+    from rapidfuzz.distance import Levenshtein as RFLevenshtein
+    RAPIDFUZZ_AVAILABLE = True
+except ImportError:
+    RAPIDFUZZ_AVAILABLE = False
+
 # Import unidecode for transliteration
 try:
     from unidecode import unidecode
@@ -51,13 +63,15 @@ def generate_name_variations_clean(original_name: str, variation_count: int,
     variations = []
     used_variations = set()
     
-    # Detect script type
-    script = detect_script(original_name)
+    # Detect script type (plain ASCII is Latin without calling detect_script)
+    script = 'latin' if original_name.isascii() else detect_script(original_name)
     is_non_latin = (script != 'latin')
     
     # Generate rule-based variations
     
     rule_attempts = {}
+    # Alternatives for each rule, built once instead of on every retry
+    other_rules_by_rule = {rule: [r for r in rules if r != rule] for rule in set(rules)} if rules else {}
     for i in range(rule_based_count):
         if rules:
             rule = random.choice(rules)
@@ -79,7 +93,7 @@ def generate_name_variations_clean(original_name: str, variation_count: int,
                 
                 # If we've tried this rule too many times, pick a different one
                 if rule_attempts[rule] > 5:
-                    other_rules = [r for r in rules if r != rule]
+                    other_rules = other_rules_by_rule[rule]
                     if other_rules:
                         rule = random.choice(other_rules)
                         rule_attempts[rule] = 0
@@ -91,41 +105,27 @@ def generate_name_variations_clean(original_name: str, variation_count: int,
             
             # Only add if we got a valid unique variation (NEVER add numeric suffixes)
             # CRITICAL: Check uniqueness using validator's combined_similarity threshold
-            if var and var.lower() not in used_variations and var != original_name:
+            var_key = var.lower() if var else None
+            if var and var_key not in used_variations and var != original_name:
                 # Check uniqueness against all existing variations (validator's threshold: > 0.99)
-                is_unique = True
-                for existing_var in variations:
-                    phonetic_sim = calculate_phonetic_similarity_score(existing_var, var)
-                    orthographic_sim = calculate_orthographic_similarity_score(existing_var, var)
-                    combined_similarity = phonetic_sim * 0.7 + orthographic_sim * 0.3
-                    
-                    if combined_similarity > 0.99:  # Validator's uniqueness threshold
-                        is_unique = False
-                        break
+                is_unique = not any(is_too_similar(existing_var, var) for existing_var in variations)
                 
                 if is_unique:
                     variations.append(var)
-                    used_variations.add(var.lower())
+                    used_variations.add(var_key)
             elif var and var == original_name and attempts < 20:
                 # If rule didn't change the name, try a different rule
                 for alt_rule in rules:
                     if alt_rule != rule:
                         var = apply_rule_to_name(original_name, alt_rule)
-                        if var.lower() not in used_variations and var != original_name:
+                        var_key = var.lower()
+                        if var_key not in used_variations and var != original_name:
                             # Check uniqueness
-                            is_unique = True
-                            for existing_var in variations:
-                                phonetic_sim = calculate_phonetic_similarity_score(existing_var, var)
-                                orthographic_sim = calculate_orthographic_similarity_score(existing_var, var)
-                                combined_similarity = phonetic_sim * 0.7 + orthographic_sim * 0.3
-                                
-                                if combined_similarity > 0.99:
-                                    is_unique = False
-                                    break
+                            is_unique = not any(is_too_similar(existing_var, var) for existing_var in variations)
                             
                             if is_unique:
                                 variations.append(var)
-                                used_variations.add(var.lower())
+                                used_variations.add(var_key)
                                 break
     
     # Generate non-rule variations using tiered similarity targeting
@@ -141,9 +141,10 @@ def generate_name_variations_clean(original_name: str, variation_count: int,
             for var in non_latin_vars:
                 if len(variations) >= variation_count:
                     break
-                if var.lower() not in used_variations:
+                var_key = var.lower()
+                if var_key not in used_variations:
                     variations.append(var)
-                    used_variations.add(var.lower())
+                    used_variations.add(var_key)
         else:
             # For Latin scripts, use tiered similarity targeting with jellyfish
             if JELLYFISH_AVAILABLE and (phonetic_similarity or orthographic_similarity):
@@ -161,9 +162,10 @@ def generate_name_variations_clean(original_name: str, variation_count: int,
             for var in non_rule_vars:
                 if len(variations) >= variation_count:
                     break
-                if var.lower() not in used_variations:
+                var_key = var.lower()
+                if var_key not in used_variations:
                     variations.append(var)
-                    used_variations.add(var.lower())
+                    used_variations.add(var_key)
     
     # Final fallback - only if we still don't have enough
     # NEVER use numeric suffixes - use character-level transformations instead
@@ -179,95 +181,141 @@ def generate_name_variations_clean(original_name: str, variation_count: int,
             for var in non_latin_vars:
                 if len(variations) >= variation_count:
                     break
-                if var.lower() not in used_variations:
+                var_key = var.lower()
+                if var_key not in used_variations:
                     variations.append(var)
-                    used_variations.add(var.lower())
+                    used_variations.add(var_key)
         
         # For BOTH Latin and non-Latin: create character-level variations manually
         # This ensures we never fall back to numeric suffixes
         if len(variations) < variation_count:
-            remaining = variation_count - len(variations)
-            parts = original_name.split()
-            attempts = 0
-            max_attempts = remaining * 10  # Try many times to get unique variations
-            
-            while len(variations) < variation_count and attempts < max_attempts:
-                attempts += 1
-                
-                if len(parts) >= 2:
-                    # Try different part orders and combinations
-                    strategy = attempts % 6
-                    if strategy == 0:
-                        var = " ".join(parts[::-1])  # Reverse order
-                    elif strategy == 1:
-                        var = "".join(parts)  # Merge parts
-                    elif strategy == 2:
-                        var = parts[-1] + " " + " ".join(parts[:-1])  # Last name first
-                    elif strategy == 3:
-                        var = " ".join([parts[1]] + [parts[0]] + parts[2:]) if len(parts) > 2 else " ".join(parts[::-1])  # Swap first two
-                    elif strategy == 4:
-                        # Try applying character transformations to individual parts
-                        modified_parts = list(parts)
-                        part_idx = attempts % len(modified_parts)
-                        word = modified_parts[part_idx]
-                        if len(word) > 1:
-                            # Try removing a character
-                            char_idx = (attempts // len(modified_parts)) % (len(word) - 1) + 1
-                            modified_parts[part_idx] = word[:char_idx] + word[char_idx+1:]
-                            var = " ".join(modified_parts)
-                        else:
-                            var = None
-                    else:
-                        # Try merging with different separators
-                        separators = ['', '-', '_', '.']
-                        sep = separators[attempts % len(separators)]
-                        var = sep.join(parts)
-                elif len(parts) == 1 and len(parts[0]) > 1:
-                    # For single word, try various character-level transformations
-                    word = parts[0]
-                    word_len = len(word)
-                    strategy = attempts % 5
-                    
-                    if strategy == 0:
-                        # Remove a character from different positions
-                        idx = (attempts // 5) % (word_len - 1) + 1
-                        var = word[:idx] + word[idx+1:]
-                    elif strategy == 1:
-                        # Swap adjacent characters
-                        idx = (attempts // 5) % (word_len - 1)
-                        chars = list(word)
-                        chars[idx], chars[idx+1] = chars[idx+1], chars[idx]
-                        var = ''.join(chars)
-                    elif strategy == 2:
-                        # Duplicate a character
-                        idx = (attempts // 5) % word_len
-                        var = word[:idx+1] + word[idx:]
-                    elif strategy == 3:
-                        # Capitalize different positions
-                        var = word[:1].upper() + word[1:].lower() if word[0].islower() else word
-                    else:
-                        # Try vowel substitutions (common misspellings)
-                        vowels = 'aeiou'
-                        for i, char in enumerate(word.lower()):
-                            if char in vowels:
-                                # Replace with a different vowel
-                                new_vowel = vowels[(vowels.index(char) + (attempts // 5) % len(vowels)) % len(vowels)]
-                                var = word[:i] + new_vowel + word[i+1:]
-                                break
-                        else:
-                            var = word
-                else:
-                    continue
-                
+            for var in _fallback_name_variations(original_name):
+                if len(variations) >= variation_count:
+                    break
                 # Only add if valid and unique
-                if var and var.lower() not in used_variations and var != original_name:
+                var_key = var.lower()
+                if var and var_key not in used_variations and var != original_name:
                     variations.append(var)
-                    used_variations.add(var.lower())
+                    used_variations.add(var_key)
     
     # print(f"        Non-rule: {non_rule_count} {variations[:5]}")
     return variations[:variation_count]
 
 
+# Phonetic codes and edit distances are recomputed for the same strings many
+# times by the uniqueness checks, so they are memoized per string / pair
+@lru_cache(maxsize=16384)
+def _soundex(name: str) -> str:
+    return jellyfish.soundex(name)
+
+@lru_cache(maxsize=16384)
+def _metaphone(name: str) -> str:
+    return jellyfish.metaphone(name)
+
+@lru_cache(maxsize=16384)
+def _nysiis(name: str) -> str:
+    return jellyfish.nysiis(name)
+
+_PHONETIC_CODES = {
+    "soundex": _soundex,
+    "metaphone": _metaphone,
+    "nysiis": _nysiis,
+}
+
+@lru_cache(maxsize=65536)
+def _levenshtein_sorted(a: str, b: str) -> int:
+    return jellyfish.levenshtein_distance(a, b)
+
+def _levenshtein(a: str, b: str) -> int:
+    """Levenshtein distance; symmetric, so (a, b) and (b, a) share a cache entry"""
+    return _levenshtein_sorted(a, b) if a <= b else _levenshtein_sorted(b, a)
+
+@lru_cache(maxsize=4096)
+def _phonetic_weights(original: str):
+    """Algorithms and normalized weights for original (depend only on original)"""
+    # Deterministically seed based on original name (same as validator); a private
+    # generator gives the same sequence without reseeding the global one
+    rng = random.Random(hash(original) % 10000)
+    selected_algorithms = rng.sample(list(_PHONETIC_CODES.keys()), k=min(3, len(_PHONETIC_CODES)))
+    
+    # Generate random weights that sum to 1.0 (same as validator)
+    weights = [rng.random() for _ in selected_algorithms]
+    total_weight = sum(weights)
+    normalized_weights = [w / total_weight for w in weights]
+    return tuple(zip(selected_algorithms, normalized_weights))
+
+
+def generate_name_variations_batch(jobs):
+    """
+    Run generate_name_variations_clean for many names, in this process.
+    
+    Runs inline rather than on a process pool: callers are threaded (forking
+    them is unsafe), spawned workers would re-import the miner, and the
+    similarity caches warmed here are shared across the whole batch.
+    
+    Args:
+        jobs: List of (original_name, variation_count, rule_percentage, rules,
+              phonetic_similarity, orthographic_similarity) tuples
+    
+    Returns:
+        List of variation lists, in job order
+    """
+    return [generate_name_variations_clean(*job) for job in jobs]
+
+
+def _round_robin(*iterables):
+    """Interleave iterables: first item of each, then second of each, ..."""
+    sentinel = object()
+    for items in zip_longest(*iterables, fillvalue=sentinel):
+        for item in items:
+            if item is not sentinel:
+                yield item
+
+def _fallback_name_variations(original_name: str):
+    """
+    Every character-level fallback variation of original_name, each produced
+    once, strategies interleaved (never numeric suffixes).
+    """
+    parts = original_name.split()
+    if len(parts) >= 2:
+        # Different part orders and combinations
+        orders = [
+            " ".join(parts[::-1]),  # Reverse order
+            "".join(parts),  # Merge parts
+            parts[-1] + " " + " ".join(parts[:-1]),  # Last name first
+            " ".join([parts[1]] + [parts[0]] + parts[2:]),  # Swap first two
+        ]
+        # Merging with different separators
+        merged = (sep.join(parts) for sep in ('-', '_', '.'))
+        # Removing a character (never the first) from each part
+        removed = (
+            " ".join(parts[:part_idx] + [word[:char_idx] + word[char_idx+1:]] + parts[part_idx+1:])
+            for char_idx in range(1, max(len(word) for word in parts))
+            for part_idx, word in enumerate(parts)
+            if char_idx < len(word)
+        )
+        yield from _round_robin(orders, merged, removed)
+    elif len(parts) == 1 and len(parts[0]) > 1:
+        # For single word, various character-level transformations
+        word = parts[0]
+        word_len = len(word)
+        # Remove a character from different positions
+        removed = (word[:idx] + word[idx+1:] for idx in range(1, word_len))
+        # Swap adjacent characters
+        swapped = (word[:idx] + word[idx+1] + word[idx] + word[idx+2:] for idx in range(word_len - 1))
+        # Duplicate a character
+        duplicated = (word[:idx+1] + word[idx:] for idx in range(word_len))
+        # Capitalize
+        capitalized = [word[:1].upper() + word[1:].lower()] if word[0].islower() else []
+        # Vowel substitutions (common misspellings) on the first vowel
+        vowels = 'aeiou'
+        first_vowel = next((i for i, char in enumerate(word.lower()) if char in vowels), None)
+        substituted = [] if first_vowel is None else [
+            word[:first_vowel] + vowels[(vowels.index(word[first_vowel].lower()) + shift) % len(vowels)] + word[first_vowel+1:]
+            for shift in range(1, len(vowels))
+        ]
+        yield from _round_robin(removed, swapped, duplicated, capitalized, substituted)
+
 def calculate_phonetic_similarity_score(original: str, variation: str) -> float:
     """
     Calculate phonetic similarity score using same logic as validator.
@@ -279,25 +327,10 @@ def calculate_phonetic_similarity_score(original: str, variation: str) -> float:
     
     try:
         # Use same logic as validator - randomized subset of algorithms
-        algorithms = {
-            "soundex": lambda x, y: jellyfish.soundex(x) == jellyfish.soundex(y),
-            "metaphone": lambda x, y: jellyfish.metaphone(x) == jellyfish.metaphone(y),
-            "nysiis": lambda x, y: jellyfish.nysiis(x) == jellyfish.nysiis(y),
-        }
-        
-        # Deterministically seed based on original name (same as validator)
-        random.seed(hash(original) % 10000)
-        selected_algorithms = random.sample(list(algorithms.keys()), k=min(3, len(algorithms)))
-        
-        # Generate random weights that sum to 1.0 (same as validator)
-        weights = [random.random() for _ in selected_algorithms]
-        total_weight = sum(weights)
-        normalized_weights = [w / total_weight for w in weights]
-        
         # Calculate weighted phonetic score
         phonetic_score = sum(
-            (1.0 if algorithms[algo](original, variation) else 0.0) * weight
-            for algo, weight in zip(selected_algorithms, normalized_weights)
+            (1.0 if _PHONETIC_CODES[algo](original) == _PHONETIC_CODES[algo](variation) else 0.0) * weight
+            for algo, weight in _phonetic_weights(original)
         )
         
         return float(phonetic_score)
@@ -312,33 +345,33 @@ def get_metaphone_match_score(original: str, candidate: str) -> str:
     score = calculate_phonetic_similarity_score(original, candidate)
     return get_phonetic_tier_from_score(score)
 
+# Tier names indexed by tier code (0 = Far, 1 = Medium, 2 = Light)
+_TIER_NAMES = ('Far', 'Medium', 'Light')
+# Lower bounds of Medium and Light; anything below Medium (even very low similarity) is Far
+_PHONETIC_TIER_BOUNDS = (0.60, 0.80)
+_ORTHOGRAPHIC_TIER_BOUNDS = (0.50, 0.70)
+
+def get_phonetic_tier_code(score: float) -> int:
+    """Phonetic tier of a score as a code indexing _TIER_NAMES"""
+    return bisect_right(_PHONETIC_TIER_BOUNDS, score)
+
+def get_orthographic_tier_code(score: float) -> int:
+    """Orthographic tier of a score as a code indexing _TIER_NAMES"""
+    return bisect_right(_ORTHOGRAPHIC_TIER_BOUNDS, score)
+
 def get_phonetic_tier_from_score(score: float) -> str:
     """
     Categorize phonetic similarity score into Light/Medium/Far tier.
     Uses validator's exact boundaries: Light (0.80-1.00), Medium (0.60-0.79), Far (0.30-0.59)
     """
-    if score >= 0.80:
-        return 'Light'
-    elif score >= 0.60:
-        return 'Medium'
-    elif score >= 0.30:
-        return 'Far'
-    else:
-        return 'Far'  # Very low similarity
+    return _TIER_NAMES[get_phonetic_tier_code(score)]
 
 def get_orthographic_tier_from_score(score: float) -> str:
     """
     Categorize orthographic similarity score into Light/Medium/Far tier.
     Uses validator's exact boundaries: Light (0.70-1.00), Medium (0.50-0.69), Far (0.20-0.49)
     """
-    if score >= 0.70:
-        return 'Light'
-    elif score >= 0.50:
-        return 'Medium'
-    elif score >= 0.20:
-        return 'Far'
-    else:
-        return 'Far'  # Very low similarity
+    return _TIER_NAMES[get_orthographic_tier_code(score)]
 
 def get_levenshtein_tier(original: str, candidate: str) -> str:
     """
@@ -360,7 +393,7 @@ def calculate_orthographic_similarity_score(original: str, variation: str) -> fl
     
     try:
         # Use same logic as validator - Levenshtein distance
-        distance = jellyfish.levenshtein_distance(original.lower(), variation.lower())
+        distance = _levenshtein(original.lower(), variation.lower())
         max_len = max(len(original), len(variation))
         
         if max_len == 0:
@@ -373,6 +406,94 @@ def calculate_orthographic_similarity_score(original: str, variation: str) -> fl
         return 0.5  # Fallback
     
     
+def is_too_similar(original: str, variation: str) -> bool:
+    """
+    True when combined similarity (0.7 phonetic + 0.3 orthographic) is above the
+    validator's uniqueness threshold (0.99). Same result as computing both scores,
+    but skips or bounds the Levenshtein work when the threshold is out of reach.
+    """
+    phonetic_sim = calculate_phonetic_similarity_score(original, variation)
+    # Even identical spelling cannot push the score over the threshold
+    if phonetic_sim * 0.7 + 0.3 <= 0.99:
+        return False
+    
+    if JELLYFISH_AVAILABLE:
+        max_len = max(len(original), len(variation))
+        if max_len:
+            a, b = original.lower(), variation.lower()
+            # Edits still allowed above the threshold (+1 absorbs rounding)
+            needed = (0.99 - phonetic_sim * 0.7) / 0.3
+            max_edits = int((1.0 - needed) * max_len) + 1
+            if abs(len(a) - len(b)) > max_edits:
+                return False
+            # Banded, bit-parallel distance that stops once max_edits is exceeded
+            if RAPIDFUZZ_AVAILABLE and RFLevenshtein.distance(a, b, score_cutoff=max_edits) > max_edits:
+                return False
+    
+    orthographic_sim = calculate_orthographic_similarity_score(original, variation)
+    return phonetic_sim * 0.7 + orthographic_sim * 0.3 > 0.99
+
+def _combined_similarity_matrix(candidates: List[str]):
+    """
+    Combined similarity (0.7 phonetic + 0.3 orthographic) for every pair:
+    [i, j] is the score of candidates[j] against candidates[i] as the original.
+    Same arithmetic, term by term, as the scalar score functions.
+    """
+    n = len(candidates)
+    weights = [_phonetic_weights(c) for c in candidates]
+    
+    # Code-equality matrix per algorithm
+    matches = {}
+    for algo, code in _PHONETIC_CODES.items():
+        codes = np.array([code(c) for c in candidates], dtype=object)
+        matches[algo] = codes[:, None] == codes[None, :]
+    
+    # Weighted sum in each row's own algorithm order (keeps float results identical)
+    phonetic = None
+    for slot in range(len(_PHONETIC_CODES)):
+        term = np.zeros((n, n))
+        for algo in _PHONETIC_CODES:
+            rows = np.array([w[slot][0] == algo for w in weights])
+            if rows.any():
+                slot_weights = np.array([w[slot][1] for w in weights])[rows]
+                term[rows] = matches[algo][rows] * slot_weights[:, None]
+        phonetic = term if phonetic is None else phonetic + term
+    
+    # Levenshtein on lower-cased strings, normalized by the longer original length
+    lowered = [c.lower() for c in candidates]
+    distance = rf_process.cdist(lowered, lowered, scorer=RFLevenshtein.distance, dtype=np.int32)
+    lengths = np.array([len(c) for c in candidates])
+    max_len = np.maximum(lengths[:, None], lengths[None, :])
+    with np.errstate(divide='ignore', invalid='ignore'):
+        orthographic = np.where(max_len == 0, 1.0, 1.0 - distance / max_len)
+    
+    return phonetic * 0.7 + orthographic * 0.3
+
+def filter_unique_candidates(candidates: List[str]) -> List[str]:
+    """
+    Keep candidates (in order) whose combined similarity to every earlier kept
+    candidate is <= 0.99 (validator's uniqueness threshold).
+    """
+    if RAPIDFUZZ_AVAILABLE and JELLYFISH_AVAILABLE and len(candidates) > 1:
+        try:
+            similarity = _combined_similarity_matrix(candidates)
+        except Exception:
+            similarity = None
+        if similarity is not None:
+            kept = []
+            for j in range(len(candidates)):
+                if not kept or similarity[kept, j].max() <= 0.99:
+                    kept.append(j)
+            return [candidates[j] for j in kept]
+    
+    unique_candidates = []
+    for candidate in candidates:
+        is_unique = not any(is_too_similar(unique_cand, candidate) for unique_cand in unique_candidates)
+        
+        if is_unique:
+            unique_candidates.append(candidate)
+    return unique_candidates
+
 def generate_tiered_name_variations(
     original_name: str,
     non_rule_count: int,
@@ -385,12 +506,14 @@ def generate_tiered_name_variations(
     Uses jellyfish (Double Metaphone + Levenshtein) to categorize variations
     and select them to match the target distribution.
     """
+    original_lower = original_name.lower()
+    
     # Generate a large candidate pool using name_variations.py
     # Request 10x more candidates to ensure we have enough in each tier
     candidate_pool = generate_name_variations(original_name, limit=non_rule_count * 10)
     
     # Remove original name from pool
-    candidate_pool = [c for c in candidate_pool if c.lower() != original_name.lower()]
+    candidate_pool = [c for c in candidate_pool if c.lower() != original_lower]
     
     if not candidate_pool:
         # Fallback: generate simple variations
@@ -411,155 +534,109 @@ def generate_tiered_name_variations(
     for tier in ['Light', 'Medium', 'Far']:
         orthographic_counts[tier] = int(non_rule_count * orthographic_similarity.get(tier, 0.0))
     
-    # Categorize candidates by both phonetic and orthographic similarity
-    candidates_by_tiers = {
-        'phonetic': {'Light': [], 'Medium': [], 'Far': []},
-        'orthographic': {'Light': [], 'Medium': [], 'Far': []}
-    }
+    # Targets indexed by tier code, for the selection passes
+    phonetic_targets = [phonetic_counts[tier] for tier in _TIER_NAMES]
+    orthographic_targets = [orthographic_counts[tier] for tier in _TIER_NAMES]
     
-    for candidate in candidate_pool:
-        # Categorize by phonetic similarity
-        phonetic_tier = get_metaphone_match_score(original_name, candidate)
-        candidates_by_tiers['phonetic'][phonetic_tier].append(candidate)
-        
-        # Categorize by orthographic similarity
-        orthographic_tier = get_levenshtein_tier(original_name, candidate)
-        candidates_by_tiers['orthographic'][orthographic_tier].append(candidate)
+    # Similarity to the original, computed once per candidate and reused by every
+    # strategy below: candidate -> (phonetic_score, orthographic_score, phonetic_tier_code, orthographic_tier_code)
+    scores = {}
+    
+    def score(candidate):
+        if candidate not in scores:
+            phonetic_score = calculate_phonetic_similarity_score(original_name, candidate)
+            orthographic_score = calculate_orthographic_similarity_score(original_name, candidate)
+            scores[candidate] = (
+                phonetic_score,
+                orthographic_score,
+                get_phonetic_tier_code(phonetic_score),
+                get_orthographic_tier_code(orthographic_score)
+            )
+        return scores[candidate]
     
     # CRITICAL: Filter candidates for uniqueness (validator checks combined_similarity > 0.99)
     # Pre-filter candidates to ensure they're not too similar to each other
-    unique_candidates = []
-    for candidate in candidate_pool:
-        is_unique = True
-        for unique_cand in unique_candidates:
-            # Calculate combined similarity (same as validator: 0.7 phonetic + 0.3 orthographic)
-            phonetic_sim = calculate_phonetic_similarity_score(unique_cand, candidate)
-            orthographic_sim = calculate_orthographic_similarity_score(unique_cand, candidate)
-            combined_similarity = phonetic_sim * 0.7 + orthographic_sim * 0.3
-            
-            if combined_similarity > 0.99:  # Validator's uniqueness threshold
-                is_unique = False
-                break
-        
-        if is_unique:
-            unique_candidates.append(candidate)
-    
-    # Use unique candidates pool
-    candidate_pool = unique_candidates
+    candidate_pool = filter_unique_candidates(candidate_pool)
     if not candidate_pool:
         # If all candidates are too similar, generate more diverse ones
         candidate_pool = generate_name_variations(original_name, limit=non_rule_count * 20)
-        candidate_pool = [c for c in candidate_pool if c.lower() != original_name.lower()]
+        candidate_pool = [c for c in candidate_pool if c.lower() != original_lower]
     
     # Select variations to match target distribution
     # CRITICAL: Use actual similarity scores to categorize, not heuristics
     selected = []
     used = set()
     
-    # Calculate actual similarity scores for all candidates and categorize
-    candidates_with_scores = []
-    for candidate in candidate_pool:
-        if candidate.lower() in used or candidate.lower() == original_name.lower():
-            continue
-        
-        phonetic_score = calculate_phonetic_similarity_score(original_name, candidate)
-        orthographic_score = calculate_orthographic_similarity_score(original_name, candidate)
-        phonetic_tier = get_phonetic_tier_from_score(phonetic_score)
-        orthographic_tier = get_orthographic_tier_from_score(orthographic_score)
-        
-        candidates_with_scores.append({
-            'candidate': candidate,
-            'phonetic_score': phonetic_score,
-            'orthographic_score': orthographic_score,
-            'phonetic_tier': phonetic_tier,
-            'orthographic_tier': orthographic_tier
-        })
+    # Candidates in random order, with their lower-cased keys and tiers held in parallel lists
+    candidates = [c for c in candidate_pool if c.lower() != original_lower]
     
     # Shuffle for randomness
-    random.shuffle(candidates_with_scores)
+    random.shuffle(candidates)
+    candidate_keys = [candidate.lower() for candidate in candidates]
+    
+    # Calculate actual similarity scores for all candidates and categorize
+    phonetic_tiers = [score(candidate)[2] for candidate in candidates]
+    orthographic_tiers = [score(candidate)[3] for candidate in candidates]
     
     # Strategy 1: Prioritize candidates that satisfy BOTH phonetic AND orthographic requirements
     # Sort candidates by how well they match both requirements
-    for cand_data in candidates_with_scores:
-        if len(selected) >= non_rule_count:
-            break
-        
-        candidate = cand_data['candidate']
-        phonetic_tier = cand_data['phonetic_tier']
-        orthographic_tier = cand_data['orthographic_tier']
-        phonetic_score = cand_data['phonetic_score']
-        orthographic_score = cand_data['orthographic_score']
-        
-        # Count how many we've already selected in each tier
-        phonetic_selected_count = sum(1 for v in selected 
-                                     if get_phonetic_tier_from_score(
-                                         calculate_phonetic_similarity_score(original_name, v)
-                                     ) == phonetic_tier)
-        orthographic_selected_count = sum(1 for v in selected 
-                                         if get_orthographic_tier_from_score(
-                                             calculate_orthographic_similarity_score(original_name, v)
-                                         ) == orthographic_tier)
-        
-        # Check if this candidate helps us meet our targets
-        phonetic_needed = phonetic_counts.get(phonetic_tier, 0) > phonetic_selected_count
-        orthographic_needed = orthographic_counts.get(orthographic_tier, 0) > orthographic_selected_count
-        
-        # CRITICAL: Check uniqueness against already selected variations
-        # Validator checks combined_similarity > 0.99 for uniqueness penalty
-        is_unique = True
-        for selected_var in selected:
-            phonetic_sim = calculate_phonetic_similarity_score(selected_var, candidate)
-            orthographic_sim = calculate_orthographic_similarity_score(selected_var, candidate)
-            combined_similarity = phonetic_sim * 0.7 + orthographic_sim * 0.3
-            
-            if combined_similarity > 0.99:  # Validator's uniqueness threshold
-                is_unique = False
+    # How many we've already selected in each tier (updated on every append)
+    phonetic_selected = [0] * len(_TIER_NAMES)
+    orthographic_selected = [0] * len(_TIER_NAMES)
+    # Pass 1 takes only candidates that satisfy both, pass 2 those that satisfy either
+    for require_both in (True, False):
+        for candidate, key, phonetic_tier, orthographic_tier in zip(candidates, candidate_keys, phonetic_tiers, orthographic_tiers):
+            if len(selected) >= non_rule_count:
                 break
-        
-        # Priority: Select candidates that satisfy BOTH requirements first
-        if is_unique:
-            if phonetic_needed and orthographic_needed:
+            
+            if key in used:
+                continue
+            
+            # Check if this candidate helps us meet our targets
+            phonetic_needed = phonetic_targets[phonetic_tier] > phonetic_selected[phonetic_tier]
+            orthographic_needed = orthographic_targets[orthographic_tier] > orthographic_selected[orthographic_tier]
+            if require_both:
                 # Perfect match - satisfies both requirements
-                selected.append(candidate)
-                used.add(candidate.lower())
-            elif phonetic_needed or orthographic_needed:
+                if not (phonetic_needed and orthographic_needed):
+                    continue
+            elif not (phonetic_needed or orthographic_needed):
                 # Partial match - satisfies one requirement
                 # Only add if we haven't met our targets yet
-                selected.append(candidate)
-                used.add(candidate.lower())
+                continue
+            
+            # CRITICAL: Check uniqueness against already selected variations
+            # Validator checks combined_similarity > 0.99 for uniqueness penalty
+            if any(is_too_similar(selected_var, candidate) for selected_var in selected):
+                continue
+            
+            selected.append(candidate)
+            used.add(key)
+            phonetic_selected[phonetic_tier] += 1
+            orthographic_selected[orthographic_tier] += 1
     
     # Strategy 2: Fill remaining slots prioritizing candidates that meet individual requirements
     if len(selected) < non_rule_count:
         remaining = non_rule_count - len(selected)
-        for cand_data in candidates_with_scores:
+        for candidate, key in zip(candidates, candidate_keys):
             if len(selected) >= non_rule_count:
                 break
             
-            candidate = cand_data['candidate']
-            if candidate.lower() in used:
+            if key in used:
                 continue
             
             # Check uniqueness
-            is_unique = True
-            for selected_var in selected:
-                phonetic_sim = calculate_phonetic_similarity_score(selected_var, candidate)
-                orthographic_sim = calculate_orthographic_similarity_score(selected_var, candidate)
-                combined_similarity = phonetic_sim * 0.7 + orthographic_sim * 0.3
-                
-                if combined_similarity > 0.99:
-                    is_unique = False
-                    break
+            is_unique = not any(is_too_similar(selected_var, candidate) for selected_var in selected)
             
             if is_unique:
                 selected.append(candidate)
-                used.add(candidate.lower())
+                used.add(key)
     
     # Strategy 3: Generate more candidates if still needed
     if len(selected) < non_rule_count:
         remaining = non_rule_count - len(selected)
         # Generate many more candidates to ensure diversity
         extra_candidates = generate_name_variations(original_name, limit=remaining * 20)
-        extra_candidates = [c for c in extra_candidates if c.lower() != original_name.lower() and c.lower() not in used]
+        extra_candidates = [c for c in extra_candidates if c.lower() != original_lower and c.lower() not in used]
         
         # Filter for uniqueness and categorize
         for candidate in extra_candidates:
@@ -567,15 +644,7 @@ def generate_tiered_name_variations(
                 break
             
             # Check uniqueness
-            is_unique = True
-            for selected_var in selected:
-                phonetic_sim = calculate_phonetic_similarity_score(selected_var, candidate)
-                orthographic_sim = calculate_orthographic_similarity_score(selected_var, candidate)
-                combined_similarity = phonetic_sim * 0.7 + orthographic_sim * 0.3
-                
-                if combined_similarity > 0.99:
-                    is_unique = False
-                    break
+            is_unique = not any(is_too_similar(selected_var, candidate) for selected_var in selected)
             
             if is_unique:
                 selected.append(candidate)
@@ -589,10 +658,9 @@ def generate_tiered_name_variations(
         phonetic_dist = {'Light': 0, 'Medium': 0, 'Far': 0}
         orthographic_dist = {'Light': 0, 'Medium': 0, 'Far': 0}
         for var in selected:
-            phonetic_tier = get_metaphone_match_score(original_name, var)
-            orthographic_tier = get_levenshtein_tier(original_name, var)
-            phonetic_dist[phonetic_tier] += 1
-            orthographic_dist[orthographic_tier] += 1
+            _, _, phonetic_tier, orthographic_tier = score(var)
+            phonetic_dist[_TIER_NAMES[phonetic_tier]] += 1
+            orthographic_dist[_TIER_NAMES[orthographic_tier]] += 1
         
         # Optional debug output (commented out for production)
         # print(f"   📊 Distribution - Phonetic: Light={phonetic_dist['Light']}/{phonetic_counts['Light']}, Medium={phonetic_dist['Medium']}/{phonetic_counts['Medium']}, Far={phonetic_dist['Far']}/{phonetic_counts['Far']}")
@@ -601,21 +669,31 @@ def generate_tiered_name_variations(
     return selected[:non_rule_count]
 
 
+# Script character classes, checked in priority order by detect_script
+_SCRIPT_PATTERNS = (
+    # Arabic characters
+    ('arabic', re.compile(r'[\u0600-\u06FF\u0750-\u077F\u08A0-\u08FF\uFB50-\uFDFF\uFE70-\uFEFF]')),
+    # Cyrillic characters
+    ('cyrillic', re.compile(r'[\u0400-\u04FF\u0500-\u052F\u2DE0-\u2DFF\uA640-\uA69F]')),
+    # Chinese/Japanese/Korean characters
+    ('cjk', re.compile(r'[\u4E00-\u9FFF\u3040-\u309F\u30A0-\u30FF\uAC00-\uD7AF]')),
+)
+
 def detect_script(name: str) -> str:
     """Detect the script type of a name"""
-    # Check for Arabic characters
-    if re.search(r'[\u0600-\u06FF\u0750-\u077F\u08A0-\u08FF\uFB50-\uFDFF\uFE70-\uFEFF]', name):
-        return 'arabic'
-    # Check for Cyrillic characters
-    if re.search(r'[\u0400-\u04FF\u0500-\u052F\u2DE0-\u2DFF\uA640-\uA69F]', name):
-        return 'cyrillic'
-    # Check for Chinese/Japanese/Korean characters
-    if re.search(r'[\u4E00-\u9FFF\u3040-\u309F\u30A0-\u30FF\uAC00-\uD7AF]', name):
-        return 'cjk'
-    # Check if contains non-Latin characters
-    if re.search(r'[^\x00-\x7F]', name):
-        return 'non-latin'
-    return 'latin'
+    # Plain ASCII is Latin; no pattern can match
+    if name.isascii():
+        return 'latin'
+    for script, pattern in _SCRIPT_PATTERNS:
+        if pattern.search(name):
+            return script
+    # Contains non-Latin characters
+    return 'non-latin'
+
+@lru_cache(maxsize=4096)
+def _transliterate(name: str) -> str:
+    """unidecode(name), cached: a non-Latin name is transliterated by several strategies and calls"""
+    return unidecode(name)
 
 def generate_non_latin_variations(name: str, script: str, count: int):
     """Generate variations for non-Latin script names"""
@@ -671,7 +749,7 @@ def generate_non_latin_variations(name: str, script: str, count: int):
     # Strategy 2: Transliterate and generate variations (mix with script-specific)
     transliterated_vars = []
     if UNIDECODE_AVAILABLE and len(variations) < count:
-        transliterated = unidecode(name)
+        transliterated = _transliterate(name)
         if transliterated and transliterated != name:
             # Generate variations on transliterated version (limit to avoid filling all slots)
             latin_vars = generate_name_variations(transliterated, limit=max(count - len(variations), count // 2))
@@ -729,7 +807,7 @@ def generate_non_latin_variations(name: str, script: str, count: int):
     
     # Strategy 4: Add more transliterated variations if we still need more
     if UNIDECODE_AVAILABLE and len(variations) < count:
-        transliterated = unidecode(name)
+        transliterated = _transliterate(name)
         if transliterated and transliterated != name:
             # Get more transliterated variations
             remaining = count - len(variations)
@@ -747,7 +825,6 @@ def generate_non_latin_variations(name: str, script: str, count: int):
         for i in range(remaining * 2):
             if len(variations) >= count:
                 break
-            parts = name.split()
             if len(parts) >= 2:
                 # Try different part combinations
                 if i % 3 == 0:
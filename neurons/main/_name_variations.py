@@ -1,5 +1,7 @@
 import random
 
+from functools import lru_cache
+
 # phonetic substitution rules
 TRANSFORMATIONS = [
     ("ph", ["f"]),
@@ -34,7 +36,9 @@ def generate_variants_for_word(word):
 
     return {v.capitalize() for v in variants}
 
-def generate_name_variations(full_name, limit=10):
+@lru_cache(maxsize=4096)
+def _all_name_variations(full_name):
+    """Every variation of full_name (the limit only slices this, so it is cached per name)"""
     parts = full_name.split()
     variants_per_part = [generate_variants_for_word(p) for p in parts]
 
@@ -50,7 +54,10 @@ def generate_name_variations(full_name, limit=10):
     combine(0, [])
     all_variations.discard(full_name)
 
-    return list(all_variations)[:limit]
+    return tuple(all_variations)
+
+def generate_name_variations(full_name, limit=10):
+    return list(_all_name_variations(full_name)[:limit])
 
 if __name__ == "__main__":
     name = input("Enter a name: ")
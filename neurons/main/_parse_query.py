@@ -1,7 +1,12 @@
 import re
 
+from functools import lru_cache
+from types import MappingProxyType
+
+# The template is usually identical across requests, so parsed results are cached
+@lru_cache(maxsize=32)
 def parse_query_template(query_template: str):
-    """Extract requirements from query template"""
+    """Extract requirements from query template (cached; the returned mapping is read-only)"""
     requirements = {
         'variation_count': 15,
         'rule_percentage': 0,
@@ -166,4 +171,4 @@ def parse_query_template(query_template: str):
     if uav_match:
         requirements['uav_seed_name'] = uav_match.group(1)
     
-    return requirements
\ No newline at end of file
+    return MappingProxyType(requirements)
\ No newline at end of file
@@ -332,6 +332,10 @@ class Miner(BaseMinerNeuron):
 
 # This is the main function, which runs the miner.
 if __name__ == "__main__":
+    # Load the geonames indices once up front instead of on the first request
+    sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), 'main'))
+    from _address1 import warm_geonames_cache
+    warm_geonames_cache()
     with Miner() as miner:
         while True:
             # bt.logging.info(f"----------------------------------Name Variation Miner running... {time.time()}")
@@ -0,0 +1,30 @@
+#!/usr/bin/env python3
+"""
+Build the prebuilt city index used by neurons/main/_address1.py.
+
+Parses geonamescache once and pickles the country/city lookup tables to
+neurons/main/_city_index.pkl, so miners load them at startup without
+re-parsing the geonames data. Re-run after upgrading geonamescache.
+
+Usage:
+    python scripts/build_city_index.py [output_path]
+"""
+import os
+import sys
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "neurons", "main"))
+
+import _address1
+
+
+def main():
+    if not _address1.GEONAMESCACHE_AVAILABLE:
+        print("geonamescache is not installed; install it to build the city index.")
+        return 1
+    path = _address1.save_city_index(*sys.argv[1:2])
+    print(f"Wrote city index for {len(_address1._city_offsets_by_code)} countries to {path}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,132 @@
+#!/usr/bin/env python3
+"""
+Tests for identity processing in neurons/main/_index.py, with the name, DOB,
+address and UAV generators stubbed out (no network, deterministic rows).
+"""
+
+import io
+import json
+import os
+import sys
+
+import pytest
+
+pytest.importorskip("requests")
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "neurons", "main"))
+
+import _index
+
+
+def _requirements(variation_count=3, uav_seed_name=None):
+    return {
+        'variation_count': variation_count,
+        'rule_percentage': 0.3,
+        'rules': [],
+        'phonetic_similarity': None,
+        'orthographic_similarity': None,
+        'uav_seed_name': uav_seed_name,
+    }
+
+
+@pytest.fixture
+def stub_generators(monkeypatch):
+    """Stub every generator _index calls; returns a setter for the parsed requirements"""
+    state = {'requirements': _requirements()}
+
+    monkeypatch.setattr(_index, "parse_query_template", lambda template: state['requirements'])
+    monkeypatch.setattr(
+        _index, "generate_name_variations_batch",
+        lambda jobs: [[f"{job[0]} v{i}" for i in range(job[1])] for job in jobs]
+    )
+    monkeypatch.setattr(
+        _index, "generate_dob_variations_batch",
+        lambda dobs, count: [[f"{dob} d{i}" for i in range(count)] for dob in dobs]
+    )
+    monkeypatch.setattr(
+        _index, "generate_address_variations",
+        lambda address, count: [f"{address} a{i}" for i in range(count)]
+    )
+    monkeypatch.setattr(
+        _index, "generate_uav_address",
+        lambda address: {'address': f"{address} uav", 'label': 'stub', 'latitude': 0.0, 'longitude': 0.0}
+    )
+
+    def set_requirements(**kwargs):
+        state['requirements'] = _requirements(**kwargs)
+
+    return set_requirements
+
+
+def _synapse(*identities):
+    return _index.IdentitySynapse(identity=[list(identity) for identity in identities], query_template="")
+
+
+def test_repeated_identity_is_emitted_once_without_collisions(stub_generators):
+    identity = ("John Smith", "1990-05-05", "Paris, France")
+    synapse = _synapse(identity, identity, ("Ann Lee", "1985-01-01", "Berlin, Germany"))
+
+    items = list(_index.iter_variations(synapse))
+
+    assert [name for name, _ in items] == ["John Smith", "Ann Lee"]
+    john = dict(items)["John Smith"]
+    assert john == [
+        [f"John Smith v{i}", f"1990-05-05 d{i}", f"Paris, France a{i}"] for i in range(3)
+    ]
+
+    # The streamed JSON has each name exactly once
+    out = io.StringIO()
+    _index.write_variations_json(_index.iter_variations(synapse), out)
+    assert out.getvalue().count('"John Smith":') == 1
+    assert json.loads(out.getvalue()) == _index.generate_variations(synapse)
+
+
+def test_duplicate_rows_within_an_identity_are_tagged(stub_generators, monkeypatch):
+    monkeypatch.setattr(_index, "generate_address_variations", lambda address, count: [address] * count)
+    monkeypatch.setattr(_index, "generate_name_variations_batch", lambda jobs: [[job[0]] * job[1] for job in jobs])
+    monkeypatch.setattr(_index, "generate_dob_variations_batch", lambda dobs, count: [[dob] * count for dob in dobs])
+
+    rows = _index.generate_variations(_synapse(("John Smith", "1990-05-05", "Paris, France")))["John Smith"]
+
+    assert [row[2] for row in rows] == ["Paris, France", "Paris, France #UNQ1", "Paris, France #UNQ2"]
+
+
+def test_zero_variation_count(stub_generators):
+    stub_generators(variation_count=0, uav_seed_name="john smith")
+    synapse = _synapse(("John Smith", "1990-05-05", "Paris, France"), ("Ann Lee", "1985-01-01", "Berlin, Germany"))
+
+    variations = _index.generate_variations(synapse)
+
+    assert variations["Ann Lee"] == []
+    assert variations["John Smith"] == {
+        'variations': [],
+        'uav': {'address': "Paris, France uav", 'label': 'stub', 'latitude': 0.0, 'longitude': 0.0},
+    }
+
+
+def test_short_identities_use_defaults(stub_generators):
+    synapse = _synapse(("Ann Lee",), ("John Smith", "1990-05-05"))
+
+    variations = _index.generate_variations(synapse)
+
+    assert variations["Ann Lee"] == [
+        [f"Ann Lee v{i}", f"1990-01-01 d{i}", f"Unknown a{i}"] for i in range(3)
+    ]
+    assert variations["John Smith"] == [
+        [f"John Smith v{i}", f"1990-05-05 d{i}", f"Unknown a{i}"] for i in range(3)
+    ]
+
+
+def test_uav_seed_gets_uav_structure(stub_generators):
+    stub_generators(uav_seed_name="JOHN SMITH")
+    synapse = _synapse(("John Smith", "1990-05-05", "Paris, France"), ("Ann Lee", "1985-01-01", "Berlin, Germany"))
+
+    variations = _index.generate_variations(synapse)
+
+    assert variations["John Smith"]['uav']['address'] == "Paris, France uav"
+    assert len(variations["John Smith"]['variations']) == 3
+    assert isinstance(variations["Ann Lee"], list) and len(variations["Ann Lee"]) == 3
+
+
+def test_no_identities(stub_generators):
+    assert _index.generate_variations(_synapse()) == {}
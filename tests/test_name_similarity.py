@@ -0,0 +1,88 @@
+#!/usr/bin/env python3
+"""
+Check the vectorized uniqueness filter in neurons/main/_name.py against the
+scalar similarity formula (0.7 phonetic + 0.3 orthographic, > 0.99 is too similar).
+"""
+
+import os
+import sys
+
+import pytest
+
+pytest.importorskip("jellyfish")
+pytest.importorskip("rapidfuzz")
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "neurons", "main"))
+
+import _name
+from _name_variations import generate_name_variations
+
+SEED_NAMES = [
+    "John Smith",
+    "Maria Garcia",
+    "Christopher Phillips",
+    "Ann Lee",
+    "Mohammed Al Rashid",
+]
+
+# Near-duplicates that differ only in case or one letter, so some pairs cross 0.99
+EXTRA_NAMES = [
+    "JOHN SMITH",
+    "john smith",
+    "Jon Smith",
+    "John Smyth",
+    "Mariah Garcia",
+    "Marie Garcia",
+    "Ann Lea",
+    "An Lee",
+]
+
+
+def _sample_candidates():
+    candidates = list(EXTRA_NAMES)
+    for name in SEED_NAMES:
+        candidates.append(name)
+        candidates.extend(generate_name_variations(name, limit=12))
+    return list(dict.fromkeys(candidates))
+
+
+def _scalar_similarity(original, variation):
+    phonetic = _name.calculate_phonetic_similarity_score(original, variation)
+    orthographic = _name.calculate_orthographic_similarity_score(original, variation)
+    return phonetic * 0.7 + orthographic * 0.3
+
+
+def test_combined_similarity_matrix_matches_scalar():
+    candidates = _sample_candidates()
+    similarity = _name._combined_similarity_matrix(candidates)
+
+    for i, original in enumerate(candidates):
+        for j, variation in enumerate(candidates):
+            assert similarity[i, j] == _scalar_similarity(original, variation), (original, variation)
+
+
+def test_filter_unique_candidates_matches_scalar(monkeypatch):
+    candidates = _sample_candidates()
+    vectorized = _name.filter_unique_candidates(candidates)
+
+    monkeypatch.setattr(_name, "RAPIDFUZZ_AVAILABLE", False)
+    scalar = _name.filter_unique_candidates(candidates)
+
+    assert vectorized == scalar
+    # The sample must actually exercise the filter
+    assert len(vectorized) < len(candidates)
+
+
+@pytest.mark.parametrize("use_rapidfuzz", [True, False])
+def test_is_too_similar_matches_scalar(monkeypatch, use_rapidfuzz):
+    monkeypatch.setattr(_name, "RAPIDFUZZ_AVAILABLE", use_rapidfuzz)
+    candidates = _sample_candidates()
+
+    too_similar = 0
+    for original in candidates:
+        for variation in candidates:
+            expected = _scalar_similarity(original, variation) > 0.99
+            assert _name.is_too_similar(original, variation) == expected, (original, variation)
+            too_similar += expected
+    # Both outcomes must occur beyond the identical pairs
+    assert len(candidates) < too_similar < len(candidates) ** 2